@@ -13,13 +13,14 @@ Usage:
 """
 
 import argparse
-import asyncio
 import logging
 from typing import Optional
 from datetime import datetime
 
+from src.database.connection import close_db_connection
 from src.scrapers.accounts_scraper import AccountsScraper
 from src.scrapers.activities_statistics_scraper import ActivitiesAndStatisticsScraper
+from src.utils.http_client import run_with_shared_client
 
 logger = logging.getLogger(__name__)
 
@@ -87,14 +88,14 @@ def main():
 
     try:
         if args.module == "accounts":
-            asyncio.run(run_accounts_scraper())
+            run_with_shared_client(run_accounts_scraper(), on_close=(close_db_connection,))
             
         elif args.module == "activities":
-            asyncio.run(run_activities_scraper(args.section))
+            run_with_shared_client(run_activities_scraper(args.section), on_close=(close_db_connection,))
             
         elif args.module == "all":
-            asyncio.run(run_accounts_scraper())
-            asyncio.run(run_activities_scraper())
+            run_with_shared_client(run_accounts_scraper(), on_close=(close_db_connection,))
+            run_with_shared_client(run_activities_scraper(), on_close=(close_db_connection,))
             
     except Exception as e:
         logger.error(f"❌ Hata: {str(e)}")
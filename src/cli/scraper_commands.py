@@ -4,7 +4,6 @@ ESN PULSE Scraper Commands
 Bu modül, scraper komutlarını içerir.
 """
 
-import asyncio
 import logging
 from typing import Optional
 
@@ -12,9 +11,10 @@ import typer
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from src.database.connection import get_db_connection
+from src.database.connection import close_db_connection, get_db_connection
 from src.scrapers.accounts_scraper import AccountsScraper
 from src.scrapers.activities_statistics_scraper import ActivitiesAndStatisticsScraper
+from src.utils.http_client import run_with_shared_client
 
 logger = logging.getLogger(__name__)
 console = Console()
@@ -25,7 +25,7 @@ def accounts():
     """accounts.esn.org'dan ülke ve şube verilerini çeker."""
     try:
         console.print("🔄 AccountsScraper başlatılıyor...")
-        asyncio.run(_run_accounts_scraper())
+        run_with_shared_client(_run_accounts_scraper(), on_close=(close_db_connection,))
         console.print("✅ AccountsScraper başarıyla tamamlandı")
     except Exception as e:
         console.print(f"❌ AccountsScraper hatası: {str(e)}", style="red")
@@ -41,7 +41,7 @@ def activities(section: Optional[str] = typer.Option(
     """activities.esn.org'dan etkinlik ve istatistik verilerini çeker."""
     try:
         console.print("🔄 ActivitiesAndStatisticsScraper başlatılıyor...")
-        asyncio.run(_run_activities_scraper(section))
+        run_with_shared_client(_run_activities_scraper(section), on_close=(close_db_connection,))
         console.print("✅ ActivitiesAndStatisticsScraper başarıyla tamamlandı")
     except Exception as e:
         console.print(f"❌ ActivitiesAndStatisticsScraper hatası: {str(e)}", style="red")
@@ -53,12 +53,12 @@ def all():
     try:
         # Önce AccountsScraper çalıştırılır
         console.print("🔄 AccountsScraper başlatılıyor...")
-        asyncio.run(_run_accounts_scraper())
+        run_with_shared_client(_run_accounts_scraper(), on_close=(close_db_connection,))
         console.print("✅ AccountsScraper başarıyla tamamlandı")
         
         # Sonra ActivitiesAndStatisticsScraper çalıştırılır
         console.print("🔄 ActivitiesAndStatisticsScraper başlatılıyor...")
-        asyncio.run(_run_activities_scraper())
+        run_with_shared_client(_run_activities_scraper(), on_close=(close_db_connection,))
         console.print("✅ ActivitiesAndStatisticsScraper başarıyla tamamlandı")
     except Exception as e:
         console.print(f"❌ Scraper'lar çalışırken hata: {str(e)}", style="red")
@@ -34,10 +34,26 @@ class Settings(BaseSettings):
     )
     
     # Scraping Settings
-    SCRAPING_DELAY: float = Field(default=0.5, env="SCRAPING_DELAY")
+    REQUESTS_PER_SECOND: float = Field(default=2.0, env="REQUESTS_PER_SECOND")
     MAX_RETRIES: int = Field(default=3, env="MAX_RETRIES")
     REQUEST_TIMEOUT: int = Field(default=30, env="REQUEST_TIMEOUT")
     MAX_CONCURRENT_REQUESTS: int = Field(default=10, env="MAX_CONCURRENT_REQUESTS")
+    HTTP_POOL_SIZE: int = Field(default=20, env="HTTP_POOL_SIZE")
+    PER_HOST_CONCURRENCY: int = Field(default=10, env="PER_HOST_CONCURRENCY")
+    # Sayfa önbelleği broker'dan ayrı bir Redis veritabanında tutulur
+    HTTP_CACHE_ENABLED: bool = Field(default=False, env="HTTP_CACHE_ENABLED")
+    HTTP_CACHE_URL: str = Field(default="redis://localhost:6379/1", env="HTTP_CACHE_URL")
+    HTTP_CACHE_TTL: int = Field(default=86400, env="HTTP_CACHE_TTL")  # 1 gün
+    HTTP_CACHE_MAX_BODY_SIZE: int = Field(default=262144, env="HTTP_CACHE_MAX_BODY_SIZE")  # karakter
+    DETAIL_CACHE_MAX_AGE: int = Field(default=43200, env="DETAIL_CACHE_MAX_AGE")  # 12 saat
+    CONCURRENT_DETAIL_FETCHES: int = Field(default=8, env="CONCURRENT_DETAIL_FETCHES")
+    SECTION_DETAIL_CONCURRENCY: int = Field(default=8, env="SECTION_DETAIL_CONCURRENCY")
+    SLUG_VALIDATION_CONCURRENCY: int = Field(default=20, env="SLUG_VALIDATION_CONCURRENCY")
+    STATISTICS_CONCURRENCY: int = Field(default=10, env="STATISTICS_CONCURRENCY")
+    CIRCUIT_FAILURE_THRESHOLD: int = Field(default=5, env="CIRCUIT_FAILURE_THRESHOLD")
+    CIRCUIT_RECOVERY_TIMEOUT: float = Field(default=30.0, env="CIRCUIT_RECOVERY_TIMEOUT")  # saniye
+    CHUNK_JOIN_TIMEOUT_PER_PAGE: float = Field(default=36.0, env="CHUNK_JOIN_TIMEOUT_PER_PAGE")  # saniye; 5 sayfalık chunk = 180 sn
+    CHUNK_TASK_RATE_LIMIT: str = Field(default="64/m", env="CHUNK_TASK_RATE_LIMIT")  # worker başına
     
     # User Agents for rotation
     USER_AGENTS: List[str] = Field(default=[
@@ -69,6 +85,7 @@ class Settings(BaseSettings):
     
     # Performance Settings
     PAGINATION_CHUNK_SIZE: int = Field(default=5, env="PAGINATION_CHUNK_SIZE")
+    MAX_PAGES_PER_CHUNK: int = Field(default=20, env="MAX_PAGES_PER_CHUNK")
     BULK_INSERT_BATCH_SIZE: int = Field(default=100, env="BULK_INSERT_BATCH_SIZE")
     
     # Monitoring
@@ -82,10 +99,21 @@ class Settings(BaseSettings):
             raise ValueError(f"LOG_LEVEL must be one of {valid_levels}")
         return v.upper()
     
-    @validator("SCRAPING_DELAY")
-    def validate_scraping_delay(cls, v):
-        if v < 0.1:
-            raise ValueError("SCRAPING_DELAY must be at least 0.1 seconds")
+    @validator("MAX_PAGES_PER_CHUNK")
+    def validate_max_pages_per_chunk(cls, v, values):
+        if v < values.get("PAGINATION_CHUNK_SIZE", 1):
+            raise ValueError("MAX_PAGES_PER_CHUNK must be at least PAGINATION_CHUNK_SIZE")
+        return v
+    
+    @validator("HTTP_CACHE_URL")
+    def validate_http_cache_url(cls, v):
+        # Boş bırakılan değer varsayılanı ezmesin
+        return v or cls.model_fields["HTTP_CACHE_URL"].default
+    
+    @validator("REQUESTS_PER_SECOND")
+    def validate_requests_per_second(cls, v):
+        if v <= 0:
+            raise ValueError("REQUESTS_PER_SECOND must be greater than 0")
         return v
     
     class Config:
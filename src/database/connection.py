@@ -172,33 +172,52 @@ class DatabaseConnection:
             return False
 
 
-# Global database connection instance
-_db_connection: Optional[DatabaseConnection] = None
+# Database connection per event loop. asyncpg pools are bound to the loop that
+# created them; the worker's long-lived loop keeps one pool across tasks. The
+# value is the task opening the pool, so concurrent first callers share it.
+# Entries hold their loop alive and are only removed by close_db_connection,
+# which every loop teardown path must call.
+_db_connections: Dict[asyncio.AbstractEventLoop, "asyncio.Task[DatabaseConnection]"] = {}
+
+
+async def _open_db_connection() -> DatabaseConnection:
+    db = DatabaseConnection()
+    await db.initialize()
+    return db
 
 
 async def get_db_connection() -> DatabaseConnection:
     """
-    Get global database connection instance.
+    Get the running event loop's database connection instance.
     
     Returns:
         DatabaseConnection: Initialized database connection
     """
-    global _db_connection
-    
-    if _db_connection is None:
-        _db_connection = DatabaseConnection()
-        await _db_connection.initialize()
+    loop = asyncio.get_running_loop()
+    opening = _db_connections.get(loop)
+    if opening is None:
+        opening = _db_connections[loop] = asyncio.ensure_future(_open_db_connection())
     
-    return _db_connection
+    try:
+        return await asyncio.shield(opening)
+    except Exception:
+        # Let the next caller retry instead of caching the failure
+        if _db_connections.get(loop) is opening:
+            del _db_connections[loop]
+        raise
 
 
 async def close_db_connection():
-    """Close global database connection."""
-    global _db_connection
+    """Close the running event loop's database connection."""
+    opening = _db_connections.pop(asyncio.get_running_loop(), None)
+    if opening is None:
+        return
     
-    if _db_connection:
-        await _db_connection.close()
-        _db_connection = None
+    try:
+        db = await opening
+    except Exception:
+        return
+    await db.close()
 
 
 @asynccontextmanager
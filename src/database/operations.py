@@ -330,10 +330,11 @@ class DatabaseOperations:
             FROM sections
             WHERE can_scrape_activities = TRUE
             ORDER BY last_scraped ASC NULLS FIRST
+            LIMIT $1
         """
-        if limit:
-            query += f" LIMIT {limit}"
-        return await self.conn.fetch(query)
+        # LIMIT NULL tüm satırları döndürür; sorgu metni sabit kaldığı için
+        # asyncpg hazırlanmış ifadeyi önbellekten yeniden kullanır
+        return await self.conn.fetch(query, limit or None)
     
     async def get_section_by_slug(self, activities_platform_slug: str) -> Optional[Record]:
         """Şubeyi activities.esn.org slug'ına göre getirir.
@@ -364,10 +365,9 @@ class DatabaseOperations:
             SELECT *
             FROM sections
             ORDER BY last_scraped ASC NULLS FIRST
+            LIMIT $1
         """
-        if limit:
-            query += f" LIMIT {limit}"
-        return await self.conn.fetch(query)
+        return await self.conn.fetch(query, limit or None)
 
     async def update_section_last_scraped(self, section_id: int) -> Record:
         """Şubenin son scrape tarihini günceller.
@@ -8,6 +8,9 @@ from typing import Optional, List
 from datetime import date, datetime
 from pydantic import BaseModel, Field, HttpUrl, validator
 
+# Slug kontrolünde izin verilen ayraçları tek geçişte silen çeviri tablosu
+_SLUG_SEPARATORS = str.maketrans('', '', '-_')
+
 
 class ActivityModel(BaseModel):
     """
@@ -154,7 +157,7 @@ class ActivityModel(BaseModel):
         if v:
             v = v.lower().strip()
             # Event slugs can contain letters, numbers, and hyphens
-            if not v.replace('-', '').replace('_', '').isalnum():
+            if not v.translate(_SLUG_SEPARATORS).isalnum():
                 raise ValueError('Event slug must contain only letters, numbers, hyphens, and underscores')
         return v
     
@@ -162,8 +165,7 @@ class ActivityModel(BaseModel):
     def validate_title(cls, v):
         """Validate event title."""
         if v:
-            v = v.strip()
-            # Remove extra whitespace
+            # Remove extra whitespace (split() also trims both ends)
             v = ' '.join(v.split())
         return v
     
@@ -171,8 +173,7 @@ class ActivityModel(BaseModel):
     def validate_description(cls, v):
         """Validate event description."""
         if v:
-            v = v.strip()
-            # Remove extra whitespace
+            # Remove extra whitespace (split() also trims both ends)
             v = ' '.join(v.split())
             
             # Minimum length check
@@ -195,7 +196,7 @@ class ActivityModel(BaseModel):
         if v:
             v = v.upper().strip()
             # Basic validation - should be 2-3 uppercase letters
-            if len(v) in [2, 3] and v.isalpha():
+            if len(v) in (2, 3) and v.isalpha():
                 return v
             raise ValueError('Country code must be 2-3 uppercase letters')
         return v
@@ -215,15 +216,12 @@ class ActivityModel(BaseModel):
         if v is None:
             return []
         
-        # Remove empty strings and duplicates
-        cleaned = []
-        for item in v:
-            if isinstance(item, str) and item.strip():
-                cleaned_item = item.strip()
-                if cleaned_item not in cleaned:
-                    cleaned.append(cleaned_item)
-        
-        return cleaned
+        # Remove empty strings and duplicates in one pass (dict keeps order)
+        return list(dict.fromkeys(
+            cleaned_item
+            for item in v
+            if isinstance(item, str) and (cleaned_item := item.strip())
+        ))
 
     @validator('sdgs')
     def validate_sdgs(cls, v):
@@ -231,8 +229,8 @@ class ActivityModel(BaseModel):
         if v is None:
             return []
         
-        # Remove duplicates and validate numbers
-        cleaned = []
+        # Remove duplicates (first occurrence wins) and validate numbers
+        cleaned = {}
         for item in v:
             if not isinstance(item, int):
                 try:
@@ -243,10 +241,9 @@ class ActivityModel(BaseModel):
             if not 1 <= item <= 17:  # SDGs are numbered 1-17
                 raise ValueError('SDG number must be between 1 and 17')
             
-            if item not in cleaned:
-                cleaned.append(item)
+            cleaned[item] = None
         
-        return cleaned
+        return list(cleaned)
     
     @validator('is_future_event', always=True)
     def validate_is_future_event(cls, v, values):
@@ -7,6 +7,9 @@ Bu model accounts.esn.org'dan çekilen ülke bilgilerini doğrular ve yapıland
 from typing import Optional
 from pydantic import BaseModel, Field, HttpUrl, validator
 
+# Slug kontrolünde izin verilen ayraçları tek geçişte silen çeviri tablosu
+_SLUG_SEPARATORS = str.maketrans('', '', '-_')
+
 
 class CountryModel(BaseModel):
     """
@@ -71,7 +74,7 @@ class CountryModel(BaseModel):
         v = v.lower().strip()
         
         # Basic slug validation
-        if not v.replace('-', '').replace('_', '').isalnum():
+        if not v.translate(_SLUG_SEPARATORS).isalnum():
             raise ValueError('Slug must contain only letters, numbers, hyphens, and underscores')
         
         return v
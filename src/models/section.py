@@ -10,6 +10,9 @@ from decimal import Decimal
 
 from pydantic import BaseModel, Field, HttpUrl, EmailStr, validator, Json
 
+# Slug kontrolünde izin verilen ayraçları tek geçişte silen çeviri tablosu
+_SLUG_SEPARATORS = str.maketrans('', '', '-_')
+
 
 class SectionModel(BaseModel):
     """
@@ -170,7 +173,7 @@ class SectionModel(BaseModel):
         if v:
             v = v.lower().strip()
             # Basic slug validation
-            if not v.replace('-', '').replace('_', '').isalnum():
+            if not v.translate(_SLUG_SEPARATORS).isalnum():
                 raise ValueError('Accounts slug must contain only letters, numbers, hyphens, and underscores')
         return v
     
@@ -180,7 +183,7 @@ class SectionModel(BaseModel):
         if v:
             v = v.lower().strip()
             # Basic slug validation
-            if not v.replace('-', '').replace('_', '').isalnum():
+            if not v.translate(_SLUG_SEPARATORS).isalnum():
                 raise ValueError('Activities slug must contain only letters, numbers, hyphens, and underscores')
         return v
     
@@ -4,14 +4,17 @@ ESN PULSE Scrapers Package
 Bu paket, ESN platformlarından veri toplayan scraper modüllerini içerir:
 - AccountsScraper: accounts.esn.org'dan ülke ve şube bilgilerini çeker
 - ActivitiesAndStatisticsScraper: activities.esn.org'dan etkinlik ve istatistik verilerini çeker
+- ActivitiesChunkScraper: Celery chunk görevleri için tek bir sayfa aralığını çeker
 """
 
 from .accounts_scraper import AccountsScraper
 from .activities_statistics_scraper import ActivitiesAndStatisticsScraper
+from .activities_chunk_scraper import ActivitiesChunkScraper
 from .base_scraper import BaseScraper
 
 __all__ = [
     "AccountsScraper",
     "ActivitiesAndStatisticsScraper", 
+    "ActivitiesChunkScraper",
     "BaseScraper"
 ] 
\ No newline at end of file
@@ -5,16 +5,17 @@ import json
 
 from ..database.operations import DatabaseOperations
 from .base_scraper import BaseScraper
+from .constants.urls import ACCOUNTS_BASE_URL
 from .extractors.country_extractor import extract_countries
 from .extractors.section_extractor import extract_sections_for_country
-from .validators.account_validator import validate_activities_slug, validate_scraping_data
+from .validators.account_validator import validate_activities_slugs_batch, validate_scraping_data
 
 logger = logging.getLogger(__name__)
 
 class AccountsScraper(BaseScraper):
     def __init__(self):
         super().__init__()
-        self.base_url = "https://accounts.esn.org"
+        self.base_url = ACCOUNTS_BASE_URL
         self.db_ops: Optional[DatabaseOperations] = None
     
     async def __aenter__(self):
@@ -74,12 +75,12 @@ class AccountsScraper(BaseScraper):
                         # Update country's section count
                         await self.db_ops.update_country_section_count(country.country_code, len(sections))
 
-                        # Validate and save sections
-                        for section in sections:
-                            # Generate and validate activities slug
-                            if await validate_activities_slug(self, section):
-                                validated_sections += 1
+                        # Validate all activities slugs of the country concurrently
+                        slug_results = await validate_activities_slugs_batch(self, sections)
+                        validated_sections += sum(1 for is_valid in slug_results if is_valid is True)
 
+                        # Save sections
+                        for section in sections:
                             section_data = section.dict()
                             
                             # Convert all special types to appropriate database format
@@ -137,4 +138,4 @@ class AccountsScraper(BaseScraper):
             return results
 
     async def validate_data(self, data: Dict[str, Any]) -> bool:
-        return await validate_scraping_data(data)
\ No newline at end of file
+        return validate_scraping_data(data)
\ No newline at end of file
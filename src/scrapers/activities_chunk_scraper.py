@@ -0,0 +1,48 @@
+"""
+Activities Chunk Scraper
+
+Celery chunk görevleri için, veritabanı bağlantısı açmadan tek bir sayfa
+aralığındaki etkinlikleri çeken hafif scraper.
+"""
+
+import logging
+from typing import Dict, Any
+
+from .base_scraper import BaseScraper
+from .constants.urls import ACTIVITIES_BASE_URL, ORGANISATION_ACTIVITIES_PATH
+from .extractors.activity_extractor import extract_activities_chunk
+from ..models.activity import ActivityModel
+
+logger = logging.getLogger(__name__)
+
+class ActivitiesChunkScraper(BaseScraper):
+    def __init__(self, base_url: str = ACTIVITIES_BASE_URL):
+        super().__init__()
+        self.base_url = base_url
+    
+    async def scrape(
+        self,
+        section_slug: str,
+        start_page: int,
+        end_page: int
+    ) -> Dict[str, Any]:
+        """Fetch listing pages start_page..end_page and their activity details."""
+        activities_url = self.base_url + ORGANISATION_ACTIVITIES_PATH.format(slug=section_slug)
+        
+        activities = await extract_activities_chunk(
+            self,
+            activities_url,
+            start_page,
+            end_page,
+            self.base_url
+        )
+        
+        return {
+            "section_slug": section_slug,
+            "start_page": start_page,
+            "end_page": end_page,
+            "activities": activities
+        }
+    
+    async def validate_data(self, data: Dict[str, Any]) -> bool:
+        return all(isinstance(activity, ActivityModel) for activity in data.get("activities", ()))
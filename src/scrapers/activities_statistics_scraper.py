@@ -3,23 +3,55 @@ import asyncio
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from celery import group
+from celery.exceptions import TimeoutError as CeleryTimeoutError
 
 from ..database.operations import DatabaseOperations
 from .base_scraper import BaseScraper
+from .constants.urls import ACTIVITIES_BASE_URL, ORGANISATION_ACTIVITIES_PATH
 from .extractors.statistics_extractor import extract_section_statistics
-from .extractors.activity_extractor import extract_activities_for_section
+from .extractors.activity_extractor import extract_activities_from_page
 from .validators.data_validator import validate_scraping_data
-from .parsers.activity_parser import find_last_page_number, create_chunks
+from .parsers.activity_parser import find_last_page_number, plan_chunks
 from ..tasks.activities_chunk_task import scrape_activities_chunk
+from ..tasks.celery_app import CHUNK_QUEUE, celery_app
 from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+def _chunk_join_timeout(chunks: List[tuple]) -> float:
+    """Time to wait for a chunk group, proportional to the pages it covers."""
+    pages = sum(end - start + 1 for start, end in chunks)
+    return pages * settings.CHUNK_JOIN_TIMEOUT_PER_PAGE
+
+def _join_chunks(group_result, timeout: float) -> Dict[str, Any]:
+    """
+    Wait for a chunk group, keeping each result as it arrives (runs in a thread).
+    
+    Returns results keyed by task id; failed chunks come back as exceptions.
+    On timeout the chunks finished so far are returned and the rest are
+    left out, so one slow chunk does not discard the others.
+    """
+    finished: Dict[str, Any] = {}
+    try:
+        group_result.join_native(
+            timeout=timeout,
+            propagate=False,
+            callback=finished.__setitem__,
+            disable_sync_subtasks=False
+        )
+    except CeleryTimeoutError:
+        logger.error(
+            "Chunk tasks timed out after %.0fs; %d of %d finished",
+            timeout, len(finished), len(group_result.results)
+        )
+    return finished
+
 class ActivitiesAndStatisticsScraper(BaseScraper):
     def __init__(self):
         super().__init__()
-        self.base_url = "https://activities.esn.org"
+        self.base_url = ACTIVITIES_BASE_URL
         self.db_ops: Optional[DatabaseOperations] = None
+        self._worker_slots: Optional[int] = None
     
     async def __aenter__(self):
         await super().__aenter__()
@@ -62,14 +94,8 @@ class ActivitiesAndStatisticsScraper(BaseScraper):
                 
                 logger.info(f"Processing {len(sections)} sections")
                 
-                print(sections)
-                print(f"Number of sections: {len(sections)}")
-                print(f"Type of sections: {type(sections)}")
-                
                 # Process each section
-                for i, section in enumerate(sections):
-                    print(f"Processing section {i}: {section}")
-                    logger.info(f"Starting to process section: {section['name']}")
+                for section in sections:
                     try:
                         logger.info(f"Starting to process section: {section['name']}")
                         section_results = await self.process_section_parallel(section)
@@ -84,10 +110,8 @@ class ActivitiesAndStatisticsScraper(BaseScraper):
                     
                     except Exception as e:
                         error_msg = f"Failed to process section {section['name']}: {str(e)}"
-                        logger.error(error_msg)
-                        logger.error(f"Exception details: {type(e).__name__}: {str(e)}")
-                        import traceback
-                        logger.error(f"Traceback: {traceback.format_exc()}")
+                        # Traceback is formatted only if a handler emits the record
+                        logger.exception("Failed to process section %s", section['name'])
                         results["errors"].append(error_msg)
                 
                 results["end_time"] = datetime.now()
@@ -116,65 +140,119 @@ class ActivitiesAndStatisticsScraper(BaseScraper):
         
         try:
             # 1. Get first page to analyze pagination
-            activities_url = f"{self.base_url}/organisation/{section['activities_platform_slug']}/activities"
+            activities_url = self.base_url + ORGANISATION_ACTIVITIES_PATH.format(
+                slug=section['activities_platform_slug']
+            )
             first_page_url = f"{activities_url}?page=0"
             
             logger.info(f"Analyzing pagination for section {section['name']}")
             content = await self.get_page_content(first_page_url)
-            soup = await self.parse_html(content, first_page_url)
             
             # Find total pages and create chunks
-            last_page = find_last_page_number(soup)
-            chunks = create_chunks(last_page, chunk_size=settings.PAGINATION_CHUNK_SIZE)
+            last_page = find_last_page_number(content)
+            chunks = await self._plan_chunks(last_page)
             
             logger.info(f"Found {last_page + 1} pages, created {len(chunks)} chunks")
             
-            # 2. Create parallel tasks for each chunk
-            tasks = []
-            for chunk_start, chunk_end in chunks:
-                task = scrape_activities_chunk.delay(
+            # 2. Dispatch a task group covering the remaining chunks
+            group_result = None
+            if chunks:
+                job = group(
+                    scrape_activities_chunk.s(
+                        section['activities_platform_slug'],
+                        chunk_start,
+                        chunk_end,
+                        self.base_url
+                    )
+                    for chunk_start, chunk_end in chunks
+                )
+                
+                # The group publishes every chunk through a single pooled producer
+                group_result = job.apply_async()
+            
+            # 3. Fetch statistics and page 0 (already downloaded) while the workers
+            #    process the chunks
+            statistics_task = asyncio.create_task(
+                extract_section_statistics(
+                    self,
                     section['activities_platform_slug'],
-                    chunk_start,
-                    chunk_end,
                     self.base_url
                 )
-                tasks.append(task)
+            )
+            first_page_task = asyncio.create_task(
+                extract_activities_from_page(self, content, self.base_url)
+            )
             
-            # 3. Wait for all tasks to complete
-            logger.info(f"Waiting for {len(tasks)} chunk tasks to complete")
+            # 4. Wait for all tasks to complete
+            logger.info(f"Waiting for {len(chunks)} chunk tasks to complete")
             
-            for task in tasks:
-                try:
-                    chunk_activities = task.get(timeout=180)  # 3 minutes timeout per chunk
-                    all_activities.extend(chunk_activities)
-                    activities_count += len(chunk_activities)
-                    logger.info(f"Received {len(chunk_activities)} activities from chunk task")
-                    
-                except Exception as e:
-                    error_msg = f"Chunk task failed: {str(e)}"
-                    logger.error(error_msg)
-                    # Continue with other chunks even if one fails
+            # The join blocks, so it runs in a thread to keep the local fetches moving.
+            # Waiting inside a task is safe here: chunks run on workers consuming a
+            # separate queue, so they can never wait behind this task.
+            if group_result is not None:
+                join = asyncio.to_thread(
+                    _join_chunks,
+                    group_result,
+                    _chunk_join_timeout(chunks)
+                )
+            else:
+                join = asyncio.sleep(0, result={})
             
-            # 4. Process statistics (can run in parallel with activities)
             try:
-                statistics = await extract_section_statistics(
-                    self,
-                    section['activities_platform_slug'],
-                    self.base_url
+                finished, statistics, first_page_activities = await asyncio.gather(
+                    join,
+                    statistics_task,
+                    first_page_task
                 )
+            except BaseException:
+                # Don't leave the local fetches running with nobody awaiting them
+                for task in (statistics_task, first_page_task):
+                    task.cancel()
+                await asyncio.gather(statistics_task, first_page_task, return_exceptions=True)
+                raise
+            finally:
+                # Results have been consumed (or given up on); drop them from the backend
+                if group_result is not None:
+                    await asyncio.to_thread(group_result.forget)
+            
+            # Keep chunk order; chunks that did not finish in time are missing
+            chunk_results = []
+            if group_result is not None:
+                chunk_results = [
+                    finished[result.id]
+                    for result in group_result.results
+                    if result.id in finished
+                ]
+            
+            # Chunk results arrive as plain dicts (JSON-mode dumps, so msgpack can
+            # serialise them); keep page 0 in the same shape
+            all_activities.extend(
+                activity.model_dump(mode='json') for activity in first_page_activities
+            )
+            activities_count += len(first_page_activities)
+            
+            for chunk_activities in chunk_results:
+                if isinstance(chunk_activities, Exception):
+                    # Continue with other chunks even if one fails
+                    logger.error(f"Chunk task failed: {str(chunk_activities)}")
+                    continue
                 
-                if statistics:
-                    # await self.db_ops.upsert_section_statistics(statistics, section['id'])
-                    statistics_count = 1
-                    print(statistics)
-                    
-            except Exception as e:
-                logger.error(f"Failed to process statistics for {section['name']}: {str(e)}")
+                all_activities.extend(chunk_activities)
+                activities_count += len(chunk_activities)
+                logger.info(f"Received {len(chunk_activities)} activities from chunk task")
             
-            # Print activities for now (later will be saved to DB)
-            for activity in all_activities:
-                print(activity)
-                print()
+            if statistics:
+                # await self.db_ops.upsert_section_statistics(statistics, section['id'])
+                statistics_count = 1
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Statistics for {section['name']}: {statistics}")
+            else:
+                logger.error(f"Failed to process statistics for {section['name']}")
+            
+            # Log activities for now (later will be saved to DB)
+            if logger.isEnabledFor(logging.DEBUG):
+                for activity in all_activities:
+                    logger.debug(f"Activity: {activity}")
             
             # # 5. Update last_scraped timestamp
             # await self.db_ops.update_section_last_scraped(section['id'])
@@ -188,5 +266,43 @@ class ActivitiesAndStatisticsScraper(BaseScraper):
             logger.error(f"Failed to process section {section['name']} in parallel: {str(e)}")
             raise
 
+    async def _plan_chunks(self, last_page: int) -> List[tuple]:
+        """
+        Plan chunk tasks for pages 1..last_page; page 0 is processed from the
+        pagination fetch. Chunk count follows the free worker slots (see
+        plan_chunks).
+        """
+        worker_slots = await self._get_worker_slots()
+        return plan_chunks(
+            last_page,
+            worker_slots,
+            settings.PAGINATION_CHUNK_SIZE,
+            first_page=1,
+            max_chunk_size=settings.MAX_PAGES_PER_CHUNK
+        )
+    
+    async def _get_worker_slots(self) -> int:
+        """Total pool concurrency of live chunk-queue workers, inspected once per run."""
+        if self._worker_slots is None:
+            try:
+                inspector = celery_app.control.inspect(timeout=1.0)
+                stats, active_queues = await asyncio.gather(
+                    asyncio.to_thread(inspector.stats),
+                    asyncio.to_thread(inspector.active_queues)
+                )
+                self._worker_slots = sum(
+                    worker.get('pool', {}).get('max-concurrency', 1)
+                    for name, worker in (stats or {}).items()
+                    if any(
+                        queue.get('name') == CHUNK_QUEUE
+                        for queue in (active_queues or {}).get(name, ())
+                    )
+                )
+            except Exception as e:
+                logger.warning(f"Celery worker inspection failed: {str(e)}")
+                self._worker_slots = 0
+        
+        return self._worker_slots
+
     async def validate_data(self, data: Dict[str, Any]) -> bool:
-        return await validate_scraping_data(data)
\ No newline at end of file
+        return validate_scraping_data(data)
\ No newline at end of file
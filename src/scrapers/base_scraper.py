@@ -6,22 +6,35 @@ HTTP client yönetimi, hata işleme, rate limiting, retry logic vb.
 """
 
 import asyncio
-import random
 import logging
+import time
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, List
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 
 import aiohttp
-from bs4 import BeautifulSoup
+import redis.asyncio as aioredis
+from lxml import html as lxml_html
 
 from ..config import settings
-from ..utils.exceptions import ScrapingError, ValidationError
-from ..utils.http_client import ESNHTTPClient
+from ..utils.circuit_breaker import get_circuit_breaker
+from ..utils.exceptions import (
+    CircuitOpenError,
+    CloudflareError,
+    NetworkError,
+    RateLimitError,
+    ScrapingError,
+    ValidationError
+)
+from ..utils.http_client import ESNHTTPClient, backoff_delay, get_shared_client
 
 
 logger = logging.getLogger(__name__)
 
+# Activity detail pages rarely change; cached copies younger than
+# DETAIL_CACHE_MAX_AGE are served without contacting the site
+DETAIL_PAGE_MARKER = '/activity/'
+
 
 class BaseScraper(ABC):
     """
@@ -29,8 +42,10 @@ class BaseScraper(ABC):
     
     Ortak fonksiyonalite:
     - HTTP client yönetimi
-    - Rate limiting
+    - Rate limiting (shared token bucket, applied by the HTTP client)
     - Retry logic  
+    - Per-host circuit breaker
+    - Per-host bulkhead (bounded in-flight requests)
     - Error handling
     - User-Agent rotation
     - Logging
@@ -38,6 +53,8 @@ class BaseScraper(ABC):
     
     def __init__(self):
         self.http_client: Optional[ESNHTTPClient] = None
+        self._http_cache: Optional[aioredis.Redis] = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
         self.session_stats = {
             "requests_made": 0,
             "requests_failed": 0,
@@ -55,17 +72,27 @@ class BaseScraper(ABC):
         await self._cleanup_session()
         
     async def _initialize_session(self):
-        """Initialize HTTP session."""
+        """Attach the event loop's shared HTTP client and open the page cache."""
         if not self.http_client:
-            self.http_client = ESNHTTPClient()
-            await self.http_client.__aenter__()
+            self.http_client = await get_shared_client()
+        if settings.HTTP_CACHE_ENABLED and not self._http_cache:
+            self._http_cache = aioredis.Redis.from_url(
+                settings.HTTP_CACHE_URL,
+                decode_responses=True
+            )
         logger.info(f"Initialized {self.__class__.__name__} session")
         
     async def _cleanup_session(self):
-        """Cleanup HTTP session."""
-        if self.http_client:
-            await self.http_client.__aexit__(None, None, None)
-            self.http_client = None
+        """
+        Detach from the HTTP client and close the page cache.
+        
+        The shared client stays open for other scrapers on the same loop;
+        it is closed by close_shared_client (see run_with_shared_client).
+        """
+        self.http_client = None
+        if self._http_cache:
+            await self._http_cache.aclose()
+            self._http_cache = None
         
         logger.info(
             f"{self.__class__.__name__} session ended. Stats: {self.session_stats}"
@@ -87,6 +114,7 @@ class BaseScraper(ABC):
             HTML content as string
             
         Raises:
+            CircuitOpenError: If the host's circuit breaker is open
             ScrapingError: If all retries failed
         """
         if not self.http_client:
@@ -94,59 +122,184 @@ class BaseScraper(ABC):
             
         max_retries = max_retries or settings.MAX_RETRIES
         
+        cached_body = await self._get_fresh_cached(url)
+        if cached_body is not None:
+            return cached_body
+        
+        breaker = get_circuit_breaker(url)
+        
         for attempt in range(max_retries + 1):
+            # Fail fast while the host is known to be down
+            if not breaker.allow_request():
+                raise CircuitOpenError(
+                    f"Circuit open for {breaker.host}, skipping request",
+                    url=url
+                )
+            
             try:
                 self.session_stats["requests_made"] += 1
                 
-                # Rate limiting
-                delay = settings.SCRAPING_DELAY
-                await asyncio.sleep(delay)
+                logger.debug("Sending request to: %s", url)
                 
-                print(f"============================== 📡 Sending request to: {url} ==============================")
-                content = await self.http_client.get_with_retry(url, max_retries=1)
+                # Bulkhead; the HTTP client applies the shared rate limiter
+                async with self._host_slot(url):
+                    content = await self._fetch_page(url)
+                breaker.record_success()
                 self.session_stats["requests_successful"] += 1
                 
-                logger.debug(f"Successfully fetched: {url}")
+                logger.debug("Successfully fetched: %s", url)
                 return content
                 
             except Exception as e:
                 self.session_stats["requests_failed"] += 1
+                # Only outage-like failures count towards opening the circuit;
+                # any other error still means the host answered
+                if isinstance(e, (NetworkError, RateLimitError)):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
                 
-                if attempt < max_retries:
-                    # Exponential backoff
-                    wait_time = 2 ** attempt
+                # Cloudflare challenges do not clear up by retrying
+                if attempt < max_retries and not isinstance(e, CloudflareError):
+                    # Capped exponential backoff with full jitter, so concurrent
+                    # failures do not retry in lockstep
+                    wait_time = backoff_delay(attempt)
+                    if isinstance(e, RateLimitError) and e.retry_after:
+                        wait_time = max(wait_time, e.retry_after)
                     logger.warning(
-                        f"Request failed (attempt {attempt + 1}/{max_retries + 1}). "
-                        f"Retrying in {wait_time}s. URL: {url}, Error: {str(e)}"
+                        "Request failed (attempt %d/%d). Retrying in %.1fs. URL: %s, Error: %s",
+                        attempt + 1, max_retries + 1, wait_time, url, e
                     )
                     await asyncio.sleep(wait_time)
                     self.session_stats["retries_performed"] += 1
                 else:
-                    logger.error(f"All retries failed for URL: {url}")
+                    logger.error("Giving up on URL after %d attempt(s): %s", attempt + 1, url)
                     raise ScrapingError(url, 0, str(e))
     
-    async def parse_html(self, content: str, url: str) -> BeautifulSoup:
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        """
+        Return the semaphore bounding in-flight requests to the URL's host.
+        
+        Capped at PER_HOST_CONCURRENCY, the connector's per-host limit, so
+        excess requests wait here instead of queueing on the connector
+        where the wait would count against the request timeout.
+        """
+        host = urlsplit(url).netloc
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(settings.PER_HOST_CONCURRENCY)
+        return slot
+    
+    async def _get_fresh_cached(self, url: str) -> Optional[str]:
+        """
+        Return a cached detail page body that is still fresh, or None.
+        
+        Fresh hits skip both the network and the rate limiter.
+        """
+        if not self._http_cache or DETAIL_PAGE_MARKER not in url:
+            return None
+        
+        try:
+            body, fetched_at = await self._http_cache.hmget(
+                f"cache:page:{url}", "body", "fetched_at"
+            )
+        except Exception as e:
+            logger.warning("HTTP cache unavailable, disabling it: %s", e)
+            self._http_cache = None
+            return None
+        
+        if body is None or fetched_at is None:
+            return None
+        if time.time() - float(fetched_at) > settings.DETAIL_CACHE_MAX_AGE:
+            return None
+        
+        logger.debug("Serving fresh cached detail page: %s", url)
+        return body
+    
+    async def _fetch_page(self, url: str) -> str:
         """
-        Parse HTML content using BeautifulSoup.
+        Fetch a page, revalidating against the Redis page cache when enabled.
+        
+        Cached pages are sent with If-None-Match / If-Modified-Since; on
+        304 Not Modified the cached body is returned without re-downloading.
+        Bodies larger than HTTP_CACHE_MAX_BODY_SIZE are never stored.
+        Cache failures never fail the request: the cache is disabled for the
+        rest of the session and the page is fetched normally.
+        """
+        if not self._http_cache:
+            return await self.http_client.get_with_retry(url, max_retries=1)
+        
+        cache_key = f"cache:page:{url}"
+        try:
+            cached = await self._http_cache.hgetall(cache_key)
+        except Exception as e:
+            logger.warning("HTTP cache unavailable, disabling it: %s", e)
+            self._http_cache = None
+            return await self.http_client.get_with_retry(url, max_retries=1)
+        
+        # Validators are only useful while the body they describe is cached
+        has_body = "body" in cached
+        status, content, validators = await self.http_client.get_conditional(
+            url,
+            etag=cached.get("etag") if has_body else None,
+            last_modified=cached.get("last_modified") if has_body else None,
+            max_retries=1
+        )
+        
+        if status == 304 and has_body:
+            logger.debug("Not modified, serving cached body: %s", url)
+            if DETAIL_PAGE_MARKER in url:
+                await self._touch_cached(cache_key)
+            return cached["body"]
+        
+        # Detail pages are stored even without validators so reruns can skip them
+        if (
+            status == 200
+            and content
+            and len(content) <= settings.HTTP_CACHE_MAX_BODY_SIZE
+            and (validators or DETAIL_PAGE_MARKER in url)
+        ):
+            try:
+                async with self._http_cache.pipeline(transaction=False) as pipe:
+                    pipe.delete(cache_key)
+                    pipe.hset(
+                        cache_key,
+                        mapping={"body": content, "fetched_at": time.time(), **validators}
+                    )
+                    pipe.expire(cache_key, settings.HTTP_CACHE_TTL)
+                    await pipe.execute()
+            except Exception as e:
+                logger.warning("Failed to store %s in HTTP cache: %s", url, e)
+        
+        return content
+    
+    async def _touch_cached(self, cache_key: str) -> None:
+        """Mark a revalidated cache entry as fresh again."""
+        try:
+            await self._http_cache.hset(cache_key, "fetched_at", time.time())
+        except Exception as e:
+            logger.warning("Failed to refresh HTTP cache entry %s: %s", cache_key, e)
+    
+    async def parse_tree(self, content: str, url: str) -> lxml_html.HtmlElement:
+        """
+        Parse HTML content into an lxml element tree.
+        
+        Every extractor works on the lxml tree with compiled XPath lookups;
+        parsing runs in a thread so the event loop keeps servicing in-flight
+        responses (lxml releases the GIL while parsing).
         
         Args:
             content: HTML content
             url: Source URL (for error context)
             
         Returns:
-            BeautifulSoup object
+            Root <html> element
             
         Raises:
             ScrapingError: If parsing fails
         """
         try:
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            # Basic validation
-            if not soup.find('html'):
-                raise ValueError("Invalid HTML content")
-                
-            return soup
+            return await asyncio.to_thread(lxml_html.document_fromstring, content)
             
         except Exception as e:
             logger.error(f"HTML parsing failed for {url}: {str(e)}")
@@ -168,9 +321,12 @@ class BaseScraper(ABC):
             
         url = base_url.format(slug=slug)
         try:
-            response = await self.http_client.head(url)
+            async with self._host_slot(url):
+                response = await self.http_client.head(url)
             exists = response.status == 200
-            logger.debug(f"Slug validation for {slug}: {exists}")
+            # Hand the keep-alive connection back to the pool right away
+            response.release()
+            logger.debug("Slug validation for %s: %s", slug, exists)
             return exists
             
         except Exception as e:
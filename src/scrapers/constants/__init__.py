@@ -3,5 +3,21 @@ Constants modules for activities.esn.org platform.
 """
 
 from .country_mappings import COUNTRY_MAPPING
+from .urls import (
+    ACCOUNTS_BASE_URL,
+    ACTIVITIES_BASE_URL,
+    ACTIVITIES_ORGANISATION_URL,
+    ACTIVITIES_SLUG_URL_TEMPLATE,
+    ORGANISATION_ACTIVITIES_PATH,
+    ORGANISATION_STATISTICS_PATH
+)
 
-__all__ = ['COUNTRY_MAPPING']
\ No newline at end of file
+__all__ = [
+    'COUNTRY_MAPPING',
+    'ACCOUNTS_BASE_URL',
+    'ACTIVITIES_BASE_URL',
+    'ACTIVITIES_ORGANISATION_URL',
+    'ACTIVITIES_SLUG_URL_TEMPLATE',
+    'ORGANISATION_ACTIVITIES_PATH',
+    'ORGANISATION_STATISTICS_PATH'
+]
\ No newline at end of file
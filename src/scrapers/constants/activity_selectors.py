@@ -2,6 +2,8 @@
 CSS selectors for activity parsing from activities.esn.org platform.
 """
 
+LAST_PAGE_TITLE = "Go to last page"
+
 ACTIVITY_SELECTORS = {
     "title": {
         "primary": ".block--eg-activities-theme-page-title h1 span",
@@ -20,10 +22,9 @@ ACTIVITY_SELECTORS = {
         ".field-top-wrapper.activity__field-ct-act-location .highlight-data-text span",
         ".highlight-data-text span"
     ],
-    "participants": {
-        "primary": ".highlight-data-text-big",
-        "fallback": ".highlight-data-number .highlight-data-text-big"
-    },
+    # The former ".highlight-data-number .highlight-data-text-big" fallback
+    # only matched a subset of this selector
+    "participants": ".highlight-data-text-big",
     "activity_type": {
         "primary": ".ct-physical-activity__field-ct-act-types .field__item a",
         "fallback": ".activity-types .activity-type a"
@@ -43,6 +44,7 @@ ACTIVITY_SELECTORS = {
         ".activity__field-ct-act-goal-activity .field__item",
         ".ct-online-activity__field-ct-act-goal-activity .field__item"
     ],
+    "activity_card": "article.activities-mini-preview",
     "activity_card_title": ".eg-c-card-title a",
-    "last_page": "a[title='Go to last page']"
+    "last_page": f"a[title='{LAST_PAGE_TITLE}']"
 }
\ No newline at end of file
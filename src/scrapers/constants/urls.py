@@ -0,0 +1,17 @@
+"""
+URLs for the accounts.esn.org and activities.esn.org platforms.
+"""
+
+from ...config import settings
+
+ACCOUNTS_BASE_URL = settings.ACCOUNTS_BASE_URL
+ACTIVITIES_BASE_URL = settings.ACTIVITIES_BASE_URL
+
+ACTIVITIES_ORGANISATION_URL = f"{ACTIVITIES_BASE_URL}/organisation"
+
+# Organisation page paths, appended to the activities base URL callers pass in
+ORGANISATION_ACTIVITIES_PATH = "/organisation/{slug}/activities"
+ORGANISATION_STATISTICS_PATH = "/organisation/{slug}/statistics"
+
+# URL template passed to BaseScraper.validate_slug_url
+ACTIVITIES_SLUG_URL_TEMPLATE = f"{ACTIVITIES_BASE_URL}{ORGANISATION_ACTIVITIES_PATH}"
@@ -2,7 +2,11 @@
 Extractor modules for activities.esn.org platform.
 """
 
-from .statistics_extractor import extract_section_statistics
+from .statistics_extractor import extract_section_statistics, extract_many_section_statistics
 from .activity_extractor import extract_activities_for_section
 
-__all__ = ['extract_section_statistics', 'extract_activities_for_section']
\ No newline at end of file
+__all__ = [
+    'extract_section_statistics',
+    'extract_many_section_statistics',
+    'extract_activities_for_section'
+]
\ No newline at end of file
@@ -1,11 +1,16 @@
 import asyncio
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Union
+
+from lxml import html as lxml_html
 
 from ...models.activity import ActivityModel
 from ...config import settings
+from ...utils.concurrency import bounded_gather
+from ..constants.urls import ORGANISATION_ACTIVITIES_PATH
 from ..parsers.activity_parser import (
     find_last_page_number, 
+    parse_listing_stream,
     parse_activity_from_listing, 
     parse_activity_details,
     create_chunks
@@ -13,16 +18,29 @@ from ..parsers.activity_parser import (
 
 logger = logging.getLogger(__name__)
 
+def _parse_listing_html(content: str, base_url: str) -> List[Dict[str, str]]:
+    """Collect activity URL infos from a listing page (pure, thread-safe)."""
+    url_infos = []
+    for article in parse_listing_stream(content):
+        url_info = parse_activity_from_listing(article, base_url)
+        if url_info:
+            url_infos.append(url_info)
+    return url_infos
+
+def _parse_activity_html(content: str, url: str, event_slug: str) -> Optional[ActivityModel]:
+    """Parse a detail page and build its ActivityModel (pure, thread-safe)."""
+    return parse_activity_details(lxml_html.document_fromstring(content), url, event_slug)
+
 async def extract_activities_for_section(
     http_client,
     activities_slug: str,
     base_url: str
-) -> List[Dict[str, Any]]:
+) -> List[ActivityModel]:
     if not activities_slug:
         logger.warning("No activities slug provided")
         return []
     
-    activities_url = f"{base_url}/organisation/{activities_slug}/activities"
+    activities_url = base_url + ORGANISATION_ACTIVITIES_PATH.format(slug=activities_slug)
     logger.info(f"Extracting activities from: {activities_url}")
     
     try:
@@ -33,10 +51,9 @@ async def extract_activities_for_section(
         logger.info(f"Fetching first page for pagination analysis: {first_page_url}")
         
         content = await http_client.get_page_content(first_page_url)
-        soup = await http_client.parse_html(content, first_page_url)
         
         # Find total pages
-        last_page = find_last_page_number(soup)
+        last_page = find_last_page_number(content)
         total_pages = last_page + 1  # Convert from 0-indexed to count
         logger.info(f"Found {total_pages} total pages (0-{last_page})")
         
@@ -72,87 +89,108 @@ async def extract_activities_chunk(
     start_page: int,
     end_page: int,
     base_url: str
-) -> List[Dict[str, Any]]:
+) -> List[ActivityModel]:
     chunk_activities = []
+    next_page: Optional[asyncio.Task] = None
     
     try:
         for page_num in range(start_page, end_page + 1):
             logger.info(f"Processing page {page_num}")
             
-            page_url = f"{activities_url}?page={page_num}"
-            content = await http_client.get_page_content(page_url)
-            soup = await http_client.parse_html(content, page_url)
+            if next_page is not None:
+                content = await next_page
+            else:
+                content = await http_client.get_page_content(f"{activities_url}?page={page_num}")
+            
+            # Prefetch the next listing page while this page's details are scraped
+            next_page = None
+            if page_num < end_page:
+                next_page = asyncio.create_task(
+                    http_client.get_page_content(f"{activities_url}?page={page_num + 1}")
+                )
             
             # Extract activities from this page
             page_activities = await extract_activities_from_page(
-                http_client, soup, base_url
+                http_client, content, base_url
             )
             
             chunk_activities.extend(page_activities)
             logger.info(f"Page {page_num} yielded {len(page_activities)} activities")
-            
-            # Add small delay between pages to be respectful
-            await asyncio.sleep(settings.SCRAPING_DELAY)
         
         return chunk_activities
         
     except Exception as e:
         logger.error(f"Failed to extract activities chunk {start_page}-{end_page}: {str(e)}")
         return chunk_activities
+    
+    finally:
+        # Only left pending when the loop stopped early
+        if next_page is not None:
+            next_page.cancel()
 
 async def extract_activities_from_page(
     http_client,
-    soup,
+    content: str,
     base_url: str
-) -> List[Dict[str, Any]]:
+) -> List[ActivityModel]:
     page_activities = []
     
     try:
-        # Find activity articles (both physical and online)
-        activity_articles = soup.select('article.activities-mini-preview')
-        logger.debug(f"Found {len(activity_articles)} activity articles on page")
-        
-        for article in activity_articles:
-            try:
-                # Parse basic URL info from listing
-                url_info = parse_activity_from_listing(article, base_url)
-                if not url_info:
-                    continue
-                
-                # Get detailed info from activity page
-                activity_url = url_info['url']
-                event_slug = url_info['event_slug']
-                
-                logger.debug(f"Fetching details for: {event_slug}")
-                
-                detail_content = await http_client.get_page_content(activity_url)
-                detail_soup = await http_client.parse_html(detail_content, activity_url)
-                
-                # Parse detailed information and get ActivityModel
-                activity_model = parse_activity_details(detail_soup, activity_url, event_slug)
-                
-                if activity_model:
-                    # Convert to dict for now (can keep as model if needed)
-                    activity_data = activity_model.dict()
-                    page_activities.append(activity_data)
-                    
-                # Add delay between detail requests
-                await asyncio.sleep(settings.SCRAPING_DELAY)
-                
-            except Exception as e:
-                logger.warning(f"Failed to extract activity details: {str(e)}")
-                continue
+        # Collect activity URLs from the listing (both physical and online);
+        # parsing runs in a worker thread so detail fetches keep flowing
+        url_infos = await asyncio.to_thread(_parse_listing_html, content, base_url)
+        
+        logger.debug("Found %d activity articles on page", len(url_infos))
         
+        # Fetch detail pages concurrently with a fixed pool of workers
+        results = await bounded_gather(
+            lambda url_info: fetch_activity_details(http_client, url_info),
+            url_infos,
+            settings.CONCURRENT_DETAIL_FETCHES
+        )
+        
+        page_activities = [activity for activity in results if activity]
         return page_activities
         
     except Exception as e:
         logger.error(f"Failed to extract activities from page: {str(e)}")
         return page_activities
 
-async def validate_activities_data(activities: List[Dict[str, Any]]) -> List[ActivityModel]:
+async def fetch_activity_details(
+    http_client,
+    url_info: Dict[str, str]
+) -> Optional[ActivityModel]:
+    activity_url = url_info['url']
+    event_slug = url_info['event_slug']
+    
+    try:
+        logger.debug("Fetching details for: %s", event_slug)
+        
+        detail_content = await http_client.get_page_content(activity_url)
+        if not detail_content:
+            logger.warning(f"Empty detail page for: {event_slug}")
+            return None
+        
+        # Parse detailed information and get ActivityModel off the event loop
+        return await asyncio.to_thread(
+            _parse_activity_html, detail_content, activity_url, event_slug
+        )
+        
+    except Exception as e:
+        logger.warning(f"Failed to extract activity details: {str(e)}")
+        return None
+
+async def validate_activities_data(
+    activities: List[Union[ActivityModel, Dict[str, Any]]]
+) -> List[ActivityModel]:
     validated_activities = []
     
     for activity_data in activities:
+        # Models built by parse_activity_details are already validated
+        if isinstance(activity_data, ActivityModel):
+            validated_activities.append(activity_data)
+            continue
+        
         try:
             # Convert to ActivityModel for validation
             activity = ActivityModel(**activity_data)
@@ -7,6 +7,7 @@ from typing import List
 from ...models.country import CountryModel
 from ..constants.account_selectors import ACCOUNT_SELECTORS
 from ..parsers.country_parser import parse_country_link
+from ..parsers.xpath_utils import select
 
 logger = logging.getLogger(__name__)
 
@@ -32,10 +33,10 @@ async def extract_countries(http_client, base_url: str) -> List[CountryModel]:
         content = await http_client.get_page_content(url)
         
         logger.debug(f"Parsing HTML from: {url}")
-        soup = await http_client.parse_html(content, url)
+        root = await http_client.parse_tree(content, url)
         
         countries = []
-        country_links = soup.select(ACCOUNT_SELECTORS['country_links'])
+        country_links = select(root, ACCOUNT_SELECTORS['country_links'])
         logger.info(f"Found {len(country_links)} country links")
         
         for link in country_links:
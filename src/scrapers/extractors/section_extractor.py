@@ -4,9 +4,12 @@ Section extraction functions for accounts.esn.org platform.
 
 import logging
 from typing import List, Dict, Any
+from ...config import settings
+from ...utils.concurrency import bounded_gather
 from ...models.section import SectionModel
 from ..constants.account_selectors import ACCOUNT_SELECTORS
 from ..parsers.section_parser import parse_section_link, parse_section_details
+from ..parsers.xpath_utils import select
 
 logger = logging.getLogger(__name__)
 
@@ -31,28 +34,24 @@ async def extract_sections_for_country(
     
     try:
         content = await http_client.get_page_content(url)
-        soup = await http_client.parse_html(content, url)
+        root = await http_client.parse_tree(content, url)
 
-        sections = []
-        section_links = soup.select(ACCOUNT_SELECTORS['section_links'])
+        section_links = select(root, ACCOUNT_SELECTORS['section_links'])
         section_links = [s for s in section_links if s.get('href') != '']
         
-        logger.info(f"Found {len(section_links)} unique sections")
+        sections = _parse_links(section_links, country_code, base_url)
+        logger.info(f"Found {len(sections)} unique sections")
         
-        for link in section_links:
-            # if link.get('href') == '/section/tr-ista-mar':
-            section = parse_section_link(link, country_code, base_url)
-            # Get additional details from section page
-            section_details = await extract_section_details(
-                http_client,
-                section.accounts_platform_slug,
-                base_url
-            )
-
-            # Update section with details
-            for key, value in section_details.items():
-                setattr(section, key, value)
-            sections.append(section)
+        # Get additional details from section pages concurrently
+        results = await bounded_gather(
+            lambda section: _hydrate(http_client, section, base_url),
+            sections,
+            settings.SECTION_DETAIL_CONCURRENCY
+        )
+        
+        for section, result in zip(sections, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to hydrate section {section.accounts_platform_slug}: {str(result)}")
         
         return sections
         
@@ -60,6 +59,35 @@ async def extract_sections_for_country(
         logger.error(f"Failed to extract sections for country {country_code}: {str(e)}")
         return []
 
+def _parse_links(section_links, country_code: str, base_url: str) -> List[SectionModel]:
+    """
+    Parse section link elements, skipping links that cannot be parsed.
+    
+    A section linked more than once is kept only at its first occurrence, so
+    its detail page is not fetched twice.
+    """
+    unique: Dict[str, SectionModel] = {}
+    for link in section_links:
+        section = parse_section_link(link, country_code, base_url)
+        if section:
+            unique.setdefault(section.accounts_platform_slug, section)
+    return list(unique.values())
+
+async def _hydrate(
+    http_client,
+    section: SectionModel,
+    base_url: str
+) -> None:
+    """Fetch a section's detail page and update the model in place."""
+    section_details = await extract_section_details(
+        http_client,
+        section.accounts_platform_slug,
+        base_url
+    )
+    
+    for key, value in section_details.items():
+        setattr(section, key, value)
+
 async def extract_section_details(
     http_client,
     accounts_slug: str,
@@ -81,9 +109,9 @@ async def extract_section_details(
     
     try:
         content = await http_client.get_page_content(url)
-        soup = await http_client.parse_html(content, url)
+        root = await http_client.parse_tree(content, url)
         
-        return parse_section_details(soup, base_url)
+        return parse_section_details(root, base_url)
         
     except Exception as e:
         logger.warning(f"Failed to extract details for section {accounts_slug}: {str(e)}")
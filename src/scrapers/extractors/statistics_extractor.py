@@ -1,6 +1,9 @@
-import json
+import io
 import logging
-from typing import Optional
+from typing import Any, Dict, List, Optional, Union
+
+import ijson
+import orjson
 
 from ...models.section_statistics import (
     SectionStatisticsModel,
@@ -9,27 +12,55 @@ from ...models.section_statistics import (
     SectionTypeStatisticsModel,
     SectionParticipantStatisticsModel
 )
+from ...config import settings
+from ...utils.concurrency import bounded_gather
+from ..constants.urls import ORGANISATION_STATISTICS_PATH
 from ..parsers.statistics_parser import parse_detailed_statistics
 
 logger = logging.getLogger(__name__)
 
+# The statistics page is only read for its Drupal settings script tag, so the
+# JSON is sliced out of the raw HTML without building any tree
+DRUPAL_SETTINGS_MARKER = 'data-drupal-selector="drupal-settings-json"'
+
+# Settings blobs above this size are streamed so only activities_statistics is
+# materialised; smaller ones are faster to decode in one go with orjson
+STREAMING_JSON_THRESHOLD = 1024 * 1024
+
+def _extract_drupal_settings(content: str) -> str:
+    """Return the raw text of the Drupal settings script tag."""
+    marker = content.find(DRUPAL_SETTINGS_MARKER)
+    if marker == -1:
+        raise ValueError("Drupal settings script tag not found")
+    
+    # Script contents are not entity-encoded, so the slice is the JSON as-is
+    start = content.index('>', marker) + 1
+    return content[start:content.index('</script>', start)]
+
+def _load_activities_statistics(raw: str) -> Dict[str, Any]:
+    if len(raw) < STREAMING_JSON_THRESHOLD:
+        return orjson.loads(raw)['activities_statistics']
+    
+    activities_stats = next(
+        ijson.items(io.BytesIO(raw.encode()), 'activities_statistics', use_float=True),
+        None
+    )
+    if activities_stats is None:
+        raise KeyError('activities_statistics')
+    return activities_stats
+
 async def extract_section_statistics(
     http_client,
     activities_slug: str,
     base_url: str
 ) -> Optional[SectionStatisticsModel]:
-    url = f"{base_url}/organisation/{activities_slug}/statistics"
-    logger.info(f"Fetching statistics from: {url}")
+    url = base_url + ORGANISATION_STATISTICS_PATH.format(slug=activities_slug)
+    logger.info("Fetching statistics from: %s", url)
     
     try:
-        # Get and parse the HTML content
+        # Get the page and slice the settings JSON out of it
         content = await http_client.get_page_content(url)
-        soup = await http_client.parse_html(content, url)
-        
-        # Find the Drupal settings script tag using selector
-        drupal_settings = soup.select_one('script[type="application/json"][data-drupal-selector="drupal-settings-json"]')
-        
-        activities_stats = json.loads(drupal_settings.string)['activities_statistics']
+        activities_stats = _load_activities_statistics(_extract_drupal_settings(content))
         
         # Extract overall statistics
         total_activities = activities_stats.get('total_activities', {}).get('values', [])
@@ -57,35 +88,38 @@ async def extract_section_statistics(
         )
         
         # Create cause statistics
-        causes = []
-        for cause_name, stats in cause_statistics.items():
-            causes.append(SectionCauseStatisticsModel(
+        causes = [
+            SectionCauseStatisticsModel(
                 section_id=0,
                 cause_name=cause_name,
                 total_count=stats.get('total', 0),
                 physical_count=stats.get('physical', 0),
                 online_count=stats.get('online', 0)
-            ))
+            )
+            for cause_name, stats in cause_statistics.items()
+        ]
         
         # Create type statistics
-        types = []
-        for type_name, stats in type_statistics.items():
-            types.append(SectionTypeStatisticsModel(
+        types = [
+            SectionTypeStatisticsModel(
                 section_id=0,
                 activity_type=type_name,
                 physical_count=stats.get('physical', 0),
                 online_count=stats.get('online', 0)
-            ))
+            )
+            for type_name, stats in type_statistics.items()
+        ]
         
         # Create participant statistics
-        participants = []
-        for participant_type, stats in participant_statistics.items():
-            participants.append(SectionParticipantStatisticsModel(
+        participants = [
+            SectionParticipantStatisticsModel(
                 section_id=0,
                 participant_type=participant_type,
                 physical_count=stats.get('physical', 0),
                 online_count=stats.get('online', 0)
-            ))
+            )
+            for participant_type, stats in participant_statistics.items()
+        ]
         
         # Create the main statistics model
         statistics = SectionStatisticsModel(
@@ -99,5 +133,27 @@ async def extract_section_statistics(
         return statistics
         
     except Exception as e:
-        logger.error(f"Failed to extract statistics for {activities_slug}: {str(e)}")
-        return None
\ No newline at end of file
+        logger.error("Failed to extract statistics for %s: %s", activities_slug, e)
+        return None
+
+async def extract_many_section_statistics(
+    http_client,
+    activities_slugs: List[str],
+    base_url: str,
+    max_concurrency: Optional[int] = None
+) -> List[Union[Optional[SectionStatisticsModel], BaseException]]:
+    """
+    Extract statistics for several sections concurrently.
+    
+    At most ``max_concurrency`` statistics pages (defaults to
+    STATISTICS_CONCURRENCY) are fetched and parsed at once. Results are
+    returned in slug order; exceptions are returned instead of raised.
+    """
+    async def _extract(activities_slug: str) -> Optional[SectionStatisticsModel]:
+        return await extract_section_statistics(http_client, activities_slug, base_url)
+    
+    return await bounded_gather(
+        _extract,
+        activities_slugs,
+        max_concurrency or settings.STATISTICS_CONCURRENCY
+    )
@@ -5,15 +5,21 @@ Parser modules for activities.esn.org platform.
 from .statistics_parser import parse_detailed_statistics
 from .activity_parser import (
     find_last_page_number,
+    parse_listing_stream,
     parse_activity_from_listing,
     parse_activity_details,
-    create_chunks
+    create_chunks,
+    create_balanced_chunks,
+    plan_chunks
 )
 
 __all__ = [
     'parse_detailed_statistics',
     'find_last_page_number',
+    'parse_listing_stream',
     'parse_activity_from_listing', 
     'parse_activity_details',
-    'create_chunks'
+    'create_chunks',
+    'create_balanced_chunks',
+    'plan_chunks'
 ]
\ No newline at end of file
@@ -1,78 +1,171 @@
+import io
 import logging
+import math
 import re
-from typing import Dict, Any, Optional, List
-from urllib.parse import urljoin
+from typing import Dict, Any, Optional, List, Iterator
 from datetime import date, datetime
-from bs4 import BeautifulSoup, Tag
+from urllib.parse import parse_qs, urlsplit
+from lxml import etree
 
 from ...models.activity import ActivityModel
 from ..constants.country_mappings import COUNTRY_MAPPING
-from ..constants.activity_selectors import ACTIVITY_SELECTORS
+from ..constants.activity_selectors import ACTIVITY_SELECTORS, LAST_PAGE_TITLE
+from .xpath_utils import ClassIndex, anchor_classes, element_text, precompile, select_one
 
 logger = logging.getLogger(__name__)
 
-def get_text_safely(element, default: str = "") -> str:
-    """Safely extract text from a BeautifulSoup element."""
-    if element:
-        return element.get_text(strip=True)
-    return default
+# Translate and compile every activity selector once, at import time
+precompile(ACTIVITY_SELECTORS)
+_ANCHOR_CLASSES = anchor_classes(ACTIVITY_SELECTORS)
 
-def parse_date_safely(date_str: str) -> Dict[str, Optional[date]]:
+# Case-insensitive view of COUNTRY_MAPPING, keyed by casefolded country name
+_COUNTRY_MAPPING_CI = {name.casefold(): code for name, code in COUNTRY_MAPPING.items()}
+
+_SDG_RE = re.compile(r'(?:Goal|SDG)\s+(\d+)', re.IGNORECASE)
+
+# Common date formats to try. Kept immutable: detail pages are parsed from
+# several threads at once.
+_DATE_FORMATS = (
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%d/%m/%Y",
+    "%d %b %Y",
+    "%d-%m-%Y",
+    "%Y-%m-%d",
+    "%B %d, %Y",
+)
+
+def _unique_texts(elements: List[etree._Element]) -> List[str]:
+    """Non-empty stripped texts of ``elements``, deduplicated in document order."""
+    return list(dict.fromkeys(filter(None, map(element_text, elements))))
+
+def _fast_parse_date(date_str: str) -> Optional[date]:
+    """Parse ISO (YYYY-MM-DD[T...]) and DD/MM/YYYY dates without strptime."""
+    try:
+        if len(date_str) >= 10 and date_str[4] == '-' and date_str[7] == '-':
+            if len(date_str) == 10 or date_str[10] == 'T':
+                return date.fromisoformat(date_str[:10])
+        elif len(date_str) == 10 and date_str[2] == '/' and date_str[5] == '/':
+            return date(int(date_str[6:]), int(date_str[3:5]), int(date_str[:2]))
+    except ValueError:
+        pass
+    return None
+
+def parse_date_safely(date_str: str, today: Optional[date] = None) -> Dict[str, Optional[date]]:
     result = {'start_date': None, 'end_date': None, 'is_future_event': False}
     
     if not date_str:
         return result
     
     try:
-        # Common date formats to try
-        date_formats = [
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%d/%m/%Y",
-            "%d %b %Y",
-            "%d-%m-%Y",
-            "%Y-%m-%d",
-            "%B %d, %Y",
-        ]
+        parsed_date = _fast_parse_date(date_str)
+        if parsed_date:
+            result['start_date'] = parsed_date
+            result['end_date'] = parsed_date
+            result['is_future_event'] = parsed_date > (today or date.today())
+            return result
         
         # Try to parse as single date first
-        for fmt in date_formats:
+        for fmt in _DATE_FORMATS:
             try:
                 parsed_date = datetime.strptime(date_str, fmt).date()
                 result['start_date'] = parsed_date
                 result['end_date'] = parsed_date
-                result['is_future_event'] = parsed_date > date.today()
+                result['is_future_event'] = parsed_date > (today or date.today())
                 return result
             except ValueError:
                 continue
         
-        logger.warning(f"Could not parse date string: {date_str}")
+        logger.warning("Could not parse date string: %s", date_str)
         
     except Exception as e:
-        logger.warning(f"Error parsing date '{date_str}': {str(e)}")
+        logger.warning("Error parsing date '%s': %s", date_str, e)
     
     return result
 
-def find_last_page_number(soup: BeautifulSoup) -> int:
+class _LastPageFound(Exception):
+    """Raised by LastPageFinder to stop parsing once the link is seen."""
+
+class LastPageFinder:
+    """
+    lxml parser target that captures the "Go to last page" link href.
+    
+    No tree is built; parsing is aborted as soon as the anchor is found.
+    """
+    
+    def __init__(self):
+        self.href: Optional[str] = None
+    
+    def start(self, tag, attrib):
+        if tag == 'a' and attrib.get('title') == LAST_PAGE_TITLE:
+            self.href = attrib.get('href')
+            raise _LastPageFound()
+    
+    def close(self) -> Optional[str]:
+        return self.href
+
+def find_last_page_number(content: str) -> int:
+    if not content:
+        return 0
+    
     try:
-        last_page_link = soup.select_one(ACTIVITY_SELECTORS["last_page"])
-        # last_page = 0
-        if last_page_link:
-            last_page = int(last_page_link['href'].split('=')[-1])
-        else:
-            last_page = 0  # If no pagination, assume only one page
+        finder = LastPageFinder()
+        parser = etree.HTMLParser(target=finder)
+        try:
+            parser.feed(content)
+            parser.close()
+        except _LastPageFound:
+            pass
+        
+        if not finder.href:
+            return 0  # If no pagination, assume only one page
         
-        return last_page
+        # Read the page parameter itself; the last "=" may belong to another
+        # query parameter (e.g. "?page=12&type=physical")
+        page = parse_qs(urlsplit(finder.href).query).get('page', ('',))[0]
+        if not page.isdigit():
+            logger.warning("Unexpected last page link: %s", finder.href)
+            return 0
+        
+        return int(page)
         
     except Exception as e:
-        logger.warning(f"Failed to find last page number: {str(e)}")
+        logger.warning("Failed to find last page number: %s", e)
         return 0
 
-def parse_activity_from_listing(article: Tag, base_url: str) -> Optional[Dict[str, str]]:
+def parse_listing_stream(content: str) -> Iterator[etree._Element]:
+    """
+    Incrementally parse a listing page and yield activity card articles.
+    
+    Only one <article> subtree is materialized at a time: each yielded
+    element is cleared (together with its already processed siblings) once
+    the caller moves on, so callers must not keep references to it.
+    """
+    if not content:
+        return
+    
+    card_class = ACTIVITY_SELECTORS["activity_card"].split('.', 1)[1]
+    events = etree.iterparse(
+        io.BytesIO(content.encode('utf-8')),
+        events=('end',),
+        tag='article',
+        html=True,
+        encoding='utf-8'
+    )
+    
+    for _, elem in events:
+        if card_class in elem.get('class', '').split():
+            yield elem
+        
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+def parse_activity_from_listing(article, base_url: str) -> Optional[Dict[str, str]]:
     try:
         # Get title link which contains the URL
-        title_elem = article.select_one(ACTIVITY_SELECTORS["activity_card_title"])
+        title_elem = select_one(article, ACTIVITY_SELECTORS["activity_card_title"])
         
-        if not title_elem:
+        if title_elem is None:
             logger.warning("No title link found in activity listing")
             return None
         
@@ -82,63 +175,65 @@ def parse_activity_from_listing(article: Tag, base_url: str) -> Optional[Dict[st
             return None
         
         if '/activity/' not in href:
-            logger.warning(f"Invalid activity URL: {href}")
+            logger.warning("Invalid activity URL: %s", href)
             return None
         
         # Extract event slug from URL
         event_slug = href.split('/activity/')[-1].strip('/')
         
+        # Listing hrefs are root-relative; plain concatenation avoids urljoin's parsing cost
         return {
-            'url': urljoin(base_url, href),
+            'url': base_url + href if href.startswith('/') else href,
             'event_slug': event_slug
         }
         
     except Exception as e:
-        logger.warning(f"Failed to parse activity from listing: {str(e)}")
+        logger.warning("Failed to parse activity from listing: %s", e)
         return None
 
-def parse_activity_details(soup: BeautifulSoup, url: str, event_slug: str) -> Optional[ActivityModel]:
+def parse_activity_details(root: etree._Element, url: str, event_slug: str) -> Optional[ActivityModel]:
     try:
+        # Index the selectors' anchor classes in one pass over the tree; each
+        # lookup below then only searches the matching subtrees
+        page = ClassIndex(root, _ANCHOR_CLASSES)
+        
         # Basic event information
-        title_elem = soup.select_one(ACTIVITY_SELECTORS["title"]["primary"])
-        if not title_elem:
-            title_elem = soup.select_one(ACTIVITY_SELECTORS["title"]["fallback"])
-        title = get_text_safely(title_elem, "Unknown Activity")
+        title_elem = page.select_first(ACTIVITY_SELECTORS["title"].values())
+        title = element_text(title_elem, "Unknown Activity")
         
         # Description - try multiple selectors
         description = "No description available"
-        for selector in ACTIVITY_SELECTORS["description"]:
-            description_element = soup.select_one(selector)
-            if description_element:
-                description = description_element.get_text(separator=' ', strip=True)
-                break
+        description_element = page.select_first(ACTIVITY_SELECTORS["description"])
+        if description_element is not None:
+            description = element_text(description_element, separator=' ')
 
         # Dates - try multiple selectors
-        date_elements = soup.select(ACTIVITY_SELECTORS["dates"]["primary"])
+        date_elements = page.select(ACTIVITY_SELECTORS["dates"]["primary"])
         if not date_elements:
-            date_elements = soup.select(ACTIVITY_SELECTORS["dates"]["fallback"])
+            date_elements = page.select(ACTIVITY_SELECTORS["dates"]["fallback"])
         
+        today = date.today()
         start_date = None
         end_date = None
         is_future_event = False
         
         if date_elements:
-            start_date_str = get_text_safely(date_elements[0])
-            date_info = parse_date_safely(start_date_str)
+            start_date_str = element_text(date_elements[0])
+            date_info = parse_date_safely(start_date_str, today)
             start_date = date_info['start_date']
             end_date = date_info['end_date']
             is_future_event = date_info['is_future_event']
             
             if len(date_elements) > 1:
-                end_date_str = get_text_safely(date_elements[1])
-                end_date_info = parse_date_safely(end_date_str)
+                end_date_str = element_text(date_elements[1])
+                end_date_info = parse_date_safely(end_date_str, today)
                 if end_date_info['start_date']:
                     end_date = end_date_info['start_date']
         
         # Default to today if no date found
         if not start_date:
-            start_date = date.today()
-            end_date = date.today()
+            start_date = today
+            end_date = today
             is_future_event = False
 
         # Location - try multiple selectors
@@ -147,80 +242,73 @@ def parse_activity_details(soup: BeautifulSoup, url: str, event_slug: str) -> Op
         location_elements = []
         
         for selector in ACTIVITY_SELECTORS["location"]:
-            location_elements = soup.select(selector)
+            location_elements = page.select(selector)
             if location_elements:
                 break
                 
         if location_elements:
-            city = get_text_safely(location_elements[0]) or "Unknown"
+            city = element_text(location_elements[0]) or "Unknown"
             if len(location_elements) > 1:
-                country_name = get_text_safely(location_elements[1])
-                country_code = COUNTRY_MAPPING.get(country_name, 'XX')
+                country_name = element_text(location_elements[1])
+                country_code = _COUNTRY_MAPPING_CI.get(country_name.casefold(), 'XX')
 
         # Participants
-        participants_element = soup.select_one(ACTIVITY_SELECTORS["participants"]["primary"])
-        if not participants_element:
-            participants_element = soup.select_one(ACTIVITY_SELECTORS["participants"]["fallback"])
+        participants_element = page.select_one(ACTIVITY_SELECTORS["participants"])
             
         participants = 0
-        if participants_element:
-            participants_text = get_text_safely(participants_element)
+        if participants_element is not None:
+            participants_text = element_text(participants_element)
             try:
-                participants = int(re.sub(r'[^\d]', '', participants_text))
+                # Keep decimal digits only; str.isdecimal matches what \d did
+                participants = int(''.join(filter(str.isdecimal, participants_text)))
             except (ValueError, TypeError):
                 participants = 0
 
         # Activity type
-        activity_type_elem = soup.select_one(ACTIVITY_SELECTORS["activity_type"]["primary"])
-        if not activity_type_elem:
-            activity_type_elem = soup.select_one(ACTIVITY_SELECTORS["activity_type"]["fallback"])
-        activity_type = get_text_safely(activity_type_elem)
+        activity_type_elem = page.select_first(ACTIVITY_SELECTORS["activity_type"].values())
+        activity_type = element_text(activity_type_elem)
 
         # Lists of related information
-        organiser_elems = soup.select(ACTIVITY_SELECTORS["organisers"]["primary"])
+        organiser_elems = page.select(ACTIVITY_SELECTORS["organisers"]["primary"])
         if not organiser_elems:
-            organiser_elems = soup.select(ACTIVITY_SELECTORS["organisers"]["fallback"])
-        organisers = [get_text_safely(a) for a in organiser_elems if get_text_safely(a)]
+            organiser_elems = page.select(ACTIVITY_SELECTORS["organisers"]["fallback"])
+        organisers = _unique_texts(organiser_elems)
         
-        cause_elems = soup.select(ACTIVITY_SELECTORS["causes"]["primary"])
+        cause_elems = page.select(ACTIVITY_SELECTORS["causes"]["primary"])
         if not cause_elems:
-            cause_elems = soup.select(ACTIVITY_SELECTORS["causes"]["fallback"])
-        causes = list(set([get_text_safely(a) for a in cause_elems if get_text_safely(a)]))
+            cause_elems = page.select(ACTIVITY_SELECTORS["causes"]["fallback"])
+        causes = _unique_texts(cause_elems)
 
         # SDGs
-        sdg_elements = soup.select(ACTIVITY_SELECTORS["sdgs"])
-        sdgs = []
+        sdg_elements = page.select(ACTIVITY_SELECTORS["sdgs"])
+        # Bit n of sdg_mask marks SDG n, which deduplicates and orders them
+        sdg_mask = 0
         for img in sdg_elements:
             alt_text = img.get('alt', '')
             # Try different patterns: "Goal 3", "SDG 3", etc.
-            match = re.search(r'(?:Goal|SDG)\s+(\d+)', alt_text, re.IGNORECASE)
+            match = _SDG_RE.search(alt_text)
             if match:
-                try:
-                    sdg_num = int(match.group(1))
-                    if 1 <= sdg_num <= 17:
-                        sdgs.append(sdg_num)
-                except ValueError:
-                    continue
-        sdgs = sorted(list(set(sdgs)))  # Remove duplicates and sort
+                sdg_num = int(match.group(1))
+                if 1 <= sdg_num <= 17:
+                    sdg_mask |= 1 << sdg_num
+        sdgs = [sdg_num for sdg_num in range(1, 18) if sdg_mask & (1 << sdg_num)]
 
         # Objectives
-        objective_elems = soup.select(ACTIVITY_SELECTORS["objectives"])
-        objectives = list(set([get_text_safely(s) for s in objective_elems if get_text_safely(s)]))
+        objective_elems = page.select(ACTIVITY_SELECTORS["objectives"])
+        objectives = _unique_texts(objective_elems)
 
         # Activity Goal
         activity_goal = None
-        for selector in ACTIVITY_SELECTORS["activity_goal"]:
-            activity_goal_elem = soup.select_one(selector)
-            if activity_goal_elem:
-                # Check if there are list items
-                list_items = activity_goal_elem.find_all('li')
-                if list_items:
-                    # If there are list items, join them with newlines
-                    activity_goal = '\n'.join([item.get_text(strip=True) for item in list_items if item.get_text(strip=True)])
-                else:
-                    # If no list items, get text normally
-                    activity_goal = get_text_safely(activity_goal_elem)
-                break
+        activity_goal_elem = page.select_first(ACTIVITY_SELECTORS["activity_goal"])
+        if activity_goal_elem is not None:
+            # Check if there are list items
+            list_items = list(activity_goal_elem.iterdescendants('li'))
+            if list_items:
+                # If there are list items, join them with newlines
+                activity_goal = '\n'.join(filter(None, map(element_text, list_items)))
+            else:
+                # If no list items, get text normally
+                activity_goal = element_text(activity_goal_elem)
 
         # Create ActivityModel
         activity = ActivityModel(
@@ -242,15 +330,67 @@ def parse_activity_details(soup: BeautifulSoup, url: str, event_slug: str) -> Op
             objectives=objectives
         )
 
-        logger.debug(f"Successfully created ActivityModel for: {title}")
+        logger.debug("Successfully created ActivityModel for: %s", title)
         return activity
         
     except Exception as e:
-        logger.error(f"Failed to parse activity details for {event_slug}: {str(e)}")
+        logger.error("Failed to parse activity details for %s: %s", event_slug, e)
         return None
 
-def create_chunks(last_page: int, chunk_size: int = 5) -> List[tuple]:
-    chunks = [(i, min(i + chunk_size - 1, last_page)) for i in range(0, last_page + 1, chunk_size)]
+def create_chunks(last_page: int, chunk_size: int = 5, first_page: int = 0) -> List[tuple]:
+    total_pages = last_page + 1
+    # Every chunk is full except possibly the last, which ends at last_page
+    chunks = [
+        (i, i + chunk_size - 1 if i + chunk_size <= total_pages else last_page)
+        for i in range(first_page, total_pages, chunk_size)
+    ]
+    
+    logger.debug("Created %d chunks for %d pages", len(chunks), total_pages - first_page)
+    return chunks
+
+def create_balanced_chunks(last_page: int, chunk_count: int, first_page: int = 0) -> List[tuple]:
+    """
+    Split pages first_page..last_page into ``chunk_count`` contiguous ranges
+    of near-equal size (sizes differ by at most one page).
+    """
+    total_pages = last_page - first_page + 1
+    if total_pages <= 0:
+        return []
+    chunk_count = max(1, min(chunk_count, total_pages))
+    base_size, remainder = divmod(total_pages, chunk_count)
+    
+    chunks = []
+    start = first_page
+    for i in range(chunk_count):
+        end = start + base_size + (1 if i < remainder else 0) - 1
+        chunks.append((start, end))
+        start = end + 1
+    
+    logger.debug("Created %d balanced chunks for %d pages", len(chunks), total_pages)
+    return chunks
+
+def plan_chunks(
+    last_page: int,
+    worker_slots: int,
+    min_chunk_size: int,
+    first_page: int = 0,
+    max_chunk_size: Optional[int] = None
+) -> List[tuple]:
+    """
+    Plan page ranges for first_page..last_page: as many near-equal chunks as
+    there are free worker slots, never going below ``min_chunk_size`` pages
+    per chunk, so every worker finishes at about the same time. Falls back to
+    fixed-size chunks when ``worker_slots`` is 0 (workers not inspectable).
+    
+    With ``max_chunk_size``, large sections on a small pool get more chunks
+    than slots instead of chunks too long for the task time limits; the
+    extra chunks queue behind the first ones.
+    """
+    if not worker_slots:
+        return create_chunks(last_page, chunk_size=min_chunk_size, first_page=first_page)
     
-    logger.debug(f"Created {len(chunks)} chunks for {last_page + 1} pages")
-    return chunks
\ No newline at end of file
+    total_pages = last_page - first_page + 1
+    chunk_count = max(1, min(worker_slots, math.ceil(total_pages / min_chunk_size)))
+    if max_chunk_size:
+        chunk_count = max(chunk_count, math.ceil(total_pages / max_chunk_size))
+    return create_balanced_chunks(last_page, chunk_count, first_page=first_page)
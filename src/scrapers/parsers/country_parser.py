@@ -7,15 +7,19 @@ from typing import Optional
 from urllib.parse import urljoin
 from ...models.country import CountryModel
 from ..constants.account_selectors import ACCOUNT_SELECTORS
+from .xpath_utils import element_text, precompile
 
 logger = logging.getLogger(__name__)
 
+# Listing pages are queried through lxml; compile the account selectors once
+precompile(ACCOUNT_SELECTORS)
+
 def parse_country_link(link, base_url: str) -> Optional[CountryModel]:
     """
     Parse a country link element to extract country information.
     
     Args:
-        link: BeautifulSoup element containing country link
+        link: lxml element containing country link
         base_url: Base URL for constructing full URLs
         
     Returns:
@@ -24,31 +28,31 @@ def parse_country_link(link, base_url: str) -> Optional[CountryModel]:
     try:
         href = link.get('href', '')
         if '/country/' not in href:
-            logger.warning(f"Skipping invalid link: {href}")
+            logger.warning("Skipping invalid link: %s", href)
             return None
             
         # Extract country code from URL
-        country_code = href.split('/country/')[-1].strip('/')
+        country_code = href.split('/country/')[-1].strip('/').upper()
         if not country_code or len(country_code) != 2:
-            logger.warning(f"Invalid country code: {country_code}")
+            logger.warning("Invalid country code: %s", country_code)
             return None
             
-        name = link.get_text(strip=True)
+        name = element_text(link)
         if not name:
-            logger.warning(f"Empty country name for code: {country_code}")
+            logger.warning("Empty country name for code: %s", country_code)
             return None
         
         country = CountryModel(
-            country_code=country_code.upper(),
+            country_code=country_code,
             name=name,
             slug=country_code.lower(),
             url=urljoin(base_url, href),
             section_count=0  # Will be updated later
         )
         
-        logger.debug(f"Extracted country: {country.name} ({country.country_code})")
+        logger.debug("Extracted country: %s (%s)", country.name, country.country_code)
         return country
         
     except Exception as e:
-        logger.warning(f"Failed to extract country from link {link}: {str(e)}")
+        logger.warning("Failed to extract country from link %s: %s", link, e)
         return None
\ No newline at end of file
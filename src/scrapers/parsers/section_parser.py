@@ -2,22 +2,26 @@
 Section parsing functions for accounts.esn.org platform.
 """
 
-import json
 import logging
 from typing import Dict, Any, Optional
 from urllib.parse import urljoin
 from ...models.section import SectionModel
 from ...utils.slug_generator import generate_activities_slug
 from ..constants.account_selectors import ACCOUNT_SELECTORS
+from ..constants.urls import ACTIVITIES_ORGANISATION_URL
+from .xpath_utils import element_text, precompile, select, select_one
 
 logger = logging.getLogger(__name__)
 
+# Translate and compile every account selector once, at import time
+precompile(ACCOUNT_SELECTORS)
+
 def parse_section_link(link, country_code: str, base_url: str) -> Optional[SectionModel]:
     """
     Parse a section link element to extract basic section information.
     
     Args:
-        link: BeautifulSoup element containing section link
+        link: lxml element containing section link
         country_code: Country code for the section
         base_url: Base URL for constructing full URLs
         
@@ -34,7 +38,7 @@ def parse_section_link(link, country_code: str, base_url: str) -> Optional[Secti
         if not accounts_slug:
             return None
         
-        name = link.get_text(strip=True)
+        name = element_text(link)
         if not name:
             return None
 
@@ -47,22 +51,22 @@ def parse_section_link(link, country_code: str, base_url: str) -> Optional[Secti
             accounts_platform_slug=accounts_slug,
             activities_platform_slug=activities_slug,
             accounts_url=urljoin(base_url, href),
-            activities_url=f"https://activities.esn.org/organisation/{activities_slug}"
+            activities_url=f"{ACTIVITIES_ORGANISATION_URL}/{activities_slug}"
         )
         
-        logger.debug(f"Extracted section: {section.name}")
+        logger.debug("Extracted section: %s", section.name)
         return section
         
     except Exception as e:
-        logger.warning(f"Failed to extract section from link {link}: {str(e)}")
+        logger.warning("Failed to extract section from link %s: %s", link, e)
         return None
 
-def parse_section_details(soup, base_url: str) -> Dict[str, Any]:
+def parse_section_details(root, base_url: str) -> Dict[str, Any]:
     """
     Parse section details from section page.
     
     Args:
-        soup: BeautifulSoup object of section page
+        root: lxml root element of section page
         base_url: Base URL for constructing full URLs
         
     Returns:
@@ -72,33 +76,32 @@ def parse_section_details(soup, base_url: str) -> Dict[str, Any]:
     
     try:
         # Email
-        email_elem = soup.select_one(ACCOUNT_SELECTORS['contact_email'])
-        if email_elem:
-            details['email'] = email_elem.get_text(strip=True)
+        email_elem = select_one(root, ACCOUNT_SELECTORS['contact_email'])
+        if email_elem is not None:
+            details['email'] = element_text(email_elem)
         
         # Website
-        website_elem = soup.select_one(ACCOUNT_SELECTORS['contact_website'])
-        if website_elem:
+        website_elem = select_one(root, ACCOUNT_SELECTORS['contact_website'])
+        if website_elem is not None:
             details['website'] = website_elem.get('href')
         
         # University name
-        university_elem = soup.select_one(ACCOUNT_SELECTORS['university_name'])
-        if university_elem:
-            details['university_name'] = university_elem.get_text(strip=True)
+        university_elem = select_one(root, ACCOUNT_SELECTORS['university_name'])
+        if university_elem is not None:
+            details['university_name'] = element_text(university_elem)
         
         # Address  
-        address_elem = soup.select_one(ACCOUNT_SELECTORS['address'])
-        if address_elem:
-            address_parts = []
-            for span in address_elem.select('span'):
-                text = span.get_text(strip=True)
-                if text:
-                    address_parts.append(text)
+        address_elem = select_one(root, ACCOUNT_SELECTORS['address'])
+        if address_elem is not None:
+            address_parts = [
+                text for span in address_elem.iterdescendants('span')
+                if (text := element_text(span))
+            ]
             details['address'] = ', '.join(address_parts)
         
         # Coordinates
-        coords_elem = soup.select_one(ACCOUNT_SELECTORS['coordinates'])
-        if coords_elem:
+        coords_elem = select_one(root, ACCOUNT_SELECTORS['coordinates'])
+        if coords_elem is not None:
             try:
                 lat = coords_elem.get('data-lat')
                 lng = coords_elem.get('data-lng')
@@ -110,30 +113,29 @@ def parse_section_details(soup, base_url: str) -> Dict[str, Any]:
                 pass
         
         # Logo
-        logo_elem = soup.select_one(ACCOUNT_SELECTORS['logo'])
-        if logo_elem:
+        logo_elem = select_one(root, ACCOUNT_SELECTORS['logo'])
+        if logo_elem is not None:
             details['logo_url'] = urljoin(base_url, logo_elem.get('src'))
         
         # City
-        city_elem = soup.select_one(ACCOUNT_SELECTORS['city'])
-        if city_elem:
-            details['city'] = city_elem.get_text(strip=True)
+        city_elem = select_one(root, ACCOUNT_SELECTORS['city'])
+        if city_elem is not None:
+            details['city'] = element_text(city_elem)
 
         # Social Media
-        social_media_links = soup.select(ACCOUNT_SELECTORS['social_media'])
+        social_media_links = select(root, ACCOUNT_SELECTORS['social_media'])
         social_media = {}
         for link in social_media_links:
-            title = link.get('title', '').lower()
-            if 'profile' in title:
-                # Extract platform name from title (e.g., "Facebook profile" -> "facebook")
-                platform = title.replace('profile', '').strip()
-                if platform:
-                    social_media[platform] = link.get('href')
+            # The selector already guarantees "profile" in the title
+            # Extract platform name from title (e.g., "Facebook profile" -> "facebook")
+            platform = link.get('title', '').lower().replace('profile', '').strip()
+            if platform:
+                social_media[platform] = link.get('href')
         if social_media:
             details['social_media'] = social_media
         
         return details
         
     except Exception as e:
-        logger.warning(f"Failed to extract section details: {str(e)}")
+        logger.warning("Failed to extract section details: %s", e)
         return details
\ No newline at end of file
@@ -1,20 +1,16 @@
+from collections import defaultdict
 from typing import Dict
 
+STAT_TYPES = ('total', 'physical', 'online')
+
 def parse_detailed_statistics(activities_stats: Dict, category: str) -> Dict[str, Dict[str, int]]:
-    result = {}
+    result = defaultdict(dict)
     
-    for stat_type in ['total', 'physical', 'online']:
-        key = f"{stat_type}_{category}"
-        values = activities_stats.get(key, {}).get('values', [])
+    for stat_type in STAT_TYPES:
+        values = activities_stats.get(f"{stat_type}_{category}", {}).get('values', ())
         
         for item in values:
             if len(item) >= 2:
-                name = item[0]
-                count = item[1]
-                
-                if name not in result:
-                    result[name] = {}
-                
-                result[name][stat_type] = count
+                result[item[0]][stat_type] = item[1]
     
-    return result
\ No newline at end of file
+    return dict(result)
@@ -0,0 +1,156 @@
+"""
+Compiled XPath helpers for lxml element trees.
+
+CSS selector'ları bir kez XPath'e çevirip derlenmiş halde saklar; seçim
+işlemleri tamamen lxml'in C katmanında çalışır.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from cssselect import HTMLTranslator
+from lxml import etree
+
+_translator = HTMLTranslator()
+
+# Every class attribute below the context node; the smart strings returned
+# know their element via getparent()
+_CLASS_ATTRS = etree.XPath('descendant::*/@class')
+
+# Leading "tag.class1.class2" compound of a selector, followed by the rest
+# (descendant combinator only)
+_ANCHOR_RE = re.compile(r'^([a-zA-Z][a-zA-Z0-9]*)?((?:\.[\w-]+)+)(?:\s+([^\s>+~].*))?$')
+
+
+@lru_cache(maxsize=None)
+def compile_selector(selector: str) -> etree.XPath:
+    """
+    Compile a CSS selector into a reusable XPath object.
+
+    Matches are searched among descendants only, mirroring BeautifulSoup's
+    ``select`` semantics (the context element itself is never matched).
+    """
+    return etree.XPath(_translator.css_to_xpath(selector, prefix="descendant::"))
+
+
+def precompile(selectors) -> None:
+    """Compile every selector string inside nested dicts and lists up front."""
+    if isinstance(selectors, str):
+        compile_selector(selectors)
+    elif isinstance(selectors, dict):
+        for value in selectors.values():
+            precompile(value)
+    elif isinstance(selectors, list):
+        for value in selectors:
+            precompile(value)
+
+
+def select(element, selector: str) -> List[etree._Element]:
+    """Return all descendants of ``element`` matching a CSS selector."""
+    return compile_selector(selector)(element)
+
+
+def select_one(element, selector: str) -> Optional[etree._Element]:
+    """Return the first descendant of ``element`` matching a CSS selector."""
+    matches = compile_selector(selector)(element)
+    return matches[0] if matches else None
+
+
+def select_first(element, selectors: Iterable[str]) -> Optional[etree._Element]:
+    """
+    Return the first match of the first selector in ``selectors`` that matches.
+
+    Unlike a ``"a, b"`` selector group, which returns the earliest match in
+    document order, earlier selectors always take priority.
+    """
+    for selector in selectors:
+        matches = compile_selector(selector)(element)
+        if matches:
+            return matches[0]
+    return None
+
+
+def element_text(element, default: str = "", separator: str = "") -> str:
+    """Equivalent of BeautifulSoup's ``get_text(separator, strip=True)`` for lxml elements."""
+    if element is None:
+        return default
+    return separator.join(filter(None, map(str.strip, element.itertext())))
+
+
+@lru_cache(maxsize=None)
+def _split_anchor(selector: str) -> Optional[Tuple[Optional[str], Tuple[str, ...], Optional[str]]]:
+    """Split ``selector`` into (tag, classes, rest) when it starts with a class compound."""
+    match = _ANCHOR_RE.match(selector.strip())
+    if not match:
+        return None
+    tag, classes, rest = match.groups()
+    return tag, tuple(classes[1:].split('.')), rest
+
+
+def anchor_classes(selectors) -> FrozenSet[str]:
+    """Collect the leading class of every selector inside nested dicts and lists."""
+    if isinstance(selectors, str):
+        anchor = _split_anchor(selectors)
+        return frozenset(anchor[1][:1]) if anchor else frozenset()
+    values = selectors.values() if isinstance(selectors, dict) else selectors
+    return frozenset().union(*(anchor_classes(value) for value in values))
+
+
+class ClassIndex:
+    """
+    Elements of a tree indexed by class token, built in a single traversal.
+
+    A selector such as ``.foo .bar a`` is answered by looking up the ``foo``
+    elements in the index and searching only their subtrees, instead of
+    testing the class predicate on every element of the document once per
+    selector. Results match ``select`` (document order, no duplicates).
+    Selectors that do not start with a class fall back to ``select``.
+    """
+
+    def __init__(self, root, classes: FrozenSet[str]):
+        self.root = root
+        self._classes = classes
+        self._index: Dict[str, List[etree._Element]] = {}
+        for class_attr in _CLASS_ATTRS(root):
+            for token in class_attr.split():
+                if token in classes:
+                    self._index.setdefault(token, []).append(class_attr.getparent())
+
+    def select(self, selector: str) -> List[etree._Element]:
+        """Return all descendants of the root matching a CSS selector."""
+        anchor = _split_anchor(selector)
+        if anchor is None:
+            return select(self.root, selector)
+
+        tag, classes, rest = anchor
+        if classes[0] not in self._classes:
+            # Leading class was not indexed; search the whole tree
+            return select(self.root, selector)
+
+        results: Dict[etree._Element, None] = {}
+        for element in self._index.get(classes[0], ()):
+            if tag and element.tag != tag:
+                continue
+            if len(classes) > 1 and not set(classes[1:]).issubset(element.get('class').split()):
+                continue
+            if rest is None:
+                results[element] = None
+            else:
+                # Nested anchors yield subsets of their outer anchor's matches,
+                # so insertion order stays document order
+                results.update(dict.fromkeys(compile_selector(rest)(element)))
+        return list(results)
+
+    def select_one(self, selector: str) -> Optional[etree._Element]:
+        """Return the first descendant of the root matching a CSS selector."""
+        matches = self.select(selector)
+        return matches[0] if matches else None
+
+    def select_first(self, selectors: Iterable[str]) -> Optional[etree._Element]:
+        """Like ``select_first``: earlier selectors always take priority."""
+        for selector in selectors:
+            matches = self.select(selector)
+            if matches:
+                return matches[0]
+        return None
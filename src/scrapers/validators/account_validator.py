@@ -1,6 +1,9 @@
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Union
+from ...config import settings
+from ...utils.concurrency import bounded_gather
 from ...models.section import SectionModel
+from ..constants.urls import ACTIVITIES_SLUG_URL_TEMPLATE
 
 logger = logging.getLogger(__name__)
 
@@ -22,13 +25,13 @@ async def validate_activities_slug(http_client, section: SectionModel) -> bool:
     try:
         is_valid = await http_client.validate_slug_url(
             section.activities_platform_slug,
-            "https://activities.esn.org/organisation/{slug}/activities"
+            ACTIVITIES_SLUG_URL_TEMPLATE
         )
         
         section.can_scrape_activities = is_valid
         
         if is_valid:
-            logger.debug(f"Activities slug validated: {section.activities_platform_slug}")
+            logger.debug("Activities slug validated: %s", section.activities_platform_slug)
         else:
             logger.warning(f"Invalid activities slug: {section.activities_platform_slug}")
             
@@ -39,7 +42,34 @@ async def validate_activities_slug(http_client, section: SectionModel) -> bool:
         section.can_scrape_activities = False
         return False
 
-async def validate_scraping_data(data: Dict[str, Any]) -> bool:
+async def validate_activities_slugs_batch(
+    http_client,
+    sections: List[SectionModel],
+    max_concurrency: Optional[int] = None
+) -> List[Union[bool, BaseException]]:
+    """
+    Validate activities platform slugs for many sections concurrently.
+    
+    Args:
+        http_client: HTTP client instance
+        sections: Section models with activities_platform_slug
+        max_concurrency: Maximum in-flight validations
+            (defaults to SLUG_VALIDATION_CONCURRENCY)
+        
+    Returns:
+        One result per section, in order: the validation result or the
+        exception raised while validating it
+    """
+    async def _validate(section: SectionModel) -> bool:
+        return await validate_activities_slug(http_client, section)
+    
+    return await bounded_gather(
+        _validate,
+        sections,
+        max_concurrency or settings.SLUG_VALIDATION_CONCURRENCY
+    )
+
+def validate_scraping_data(data: Dict[str, Any]) -> bool:
     """
     Validate scraped data quality.
     
@@ -56,22 +86,19 @@ async def validate_scraping_data(data: Dict[str, Any]) -> bool:
             return False
         
         # Check minimum sections
-        if data.get("sections_processed", 0) < 400:
+        processed = data.get("sections_processed", 0)
+        if processed < 400:
             logger.warning("Too few sections processed")
             return False
         
         # Check validation rate
-        processed = data.get("sections_processed", 0)
-        validated = data.get("sections_validated", 0)
-        
-        if processed > 0:
-            validation_rate = validated / processed
-            if validation_rate < 0.7:  # At least 70% should be valid
-                logger.warning(f"Low validation rate: {validation_rate:.2%}")
-                return False
+        validation_rate = data.get("sections_validated", 0) / processed
+        if validation_rate < 0.7:  # At least 70% should be valid
+            logger.warning(f"Low validation rate: {validation_rate:.2%}")
+            return False
         
         # Check error rate
-        error_count = len(data.get("errors", []))
+        error_count = len(data.get("errors") or ())
         if error_count > processed * 0.1:  # Max 10% errors
             logger.warning(f"Too many errors: {error_count}")
             return False
@@ -4,15 +4,14 @@ ESN PULSE Accounts Tasks
 Bu modül, accounts.esn.org platformundan veri çekme görevlerini içerir.
 """
 
-import asyncio
 import logging
 from datetime import datetime, timedelta
 
 from celery import shared_task
 from celery.utils.log import get_task_logger
 
-from src.database.connection import get_db_connection
 from src.scrapers.accounts_scraper import AccountsScraper
+from src.tasks.celery_app import run_async
 
 logger = get_task_logger(__name__)
 
@@ -34,7 +33,7 @@ def run_accounts_scraper(self):
     """
     try:
         # Asenkron scraper'ı çalıştır
-        asyncio.run(_run_accounts_scraper())
+        run_async(_run_accounts_scraper())
         
         logger.info("✅ AccountsScraper başarıyla tamamlandı")
         return True
@@ -44,7 +43,9 @@ def run_accounts_scraper(self):
         raise self.retry(exc=e)
 
 async def _run_accounts_scraper():
-    """AccountsScraper'ın asenkron çalıştırma fonksiyonu."""
-    async with get_db_connection() as conn:
-        scraper = AccountsScraper(conn)
-        await scraper.run() 
\ No newline at end of file
+    """AccountsScraper'ın asenkron çalıştırma fonksiyonu.
+    
+    Veritabanı bağlantısı, worker döngüsünün havuzundan scraper tarafından alınır.
+    """
+    scraper = AccountsScraper()
+    await scraper.scrape() 
\ No newline at end of file
@@ -9,13 +9,60 @@ from typing import Dict, Any, List, Optional
 from celery import shared_task
 from celery.utils.log import get_task_logger
 
-from ..scrapers.base_scraper import BaseScraper
-from ..scrapers.extractors.activity_extractor import extract_activities_chunk
+from ..config import settings
+from .celery_app import in_worker_loop, on_worker_loop_close, run_async
 
 logger = get_task_logger(__name__)
 
+# Worker alt süreci başına base_url başına tek scraper; Redis önbellek bağlantısı
+# ve host semaforları görevden göreve yeniden kurulmaz
+_scrapers: Dict[str, Any] = {}
+
+async def _get_scraper(base_url: str):
+    # Imported here: the scrapers package imports this module to dispatch chunks
+    from ..scrapers.activities_chunk_scraper import ActivitiesChunkScraper
+    
+    scraper = _scrapers.get(base_url)
+    if scraper is None:
+        scraper = ActivitiesChunkScraper(base_url)
+        await scraper.__aenter__()
+        _scrapers[base_url] = scraper
+    return scraper
+
+@on_worker_loop_close
+async def _close_scrapers() -> None:
+    while _scrapers:
+        _, scraper = _scrapers.popitem()
+        await scraper.__aexit__(None, None, None)
+
+async def _scrape_chunk(
+    section_slug: str,
+    start_page: int,
+    end_page: int,
+    base_url: str
+) -> List[Dict[str, Any]]:
+    if in_worker_loop():
+        scraper = await _get_scraper(base_url)
+        result = await scraper.scrape(section_slug, start_page, end_page)
+    else:
+        # Tek seferlik döngü (eager mod vb.): scraper döngüyle birlikte kapanır
+        from ..scrapers.activities_chunk_scraper import ActivitiesChunkScraper
+        
+        async with ActivitiesChunkScraper(base_url) as scraper:
+            result = await scraper.scrape(section_slug, start_page, end_page)
+    
+    # Modeller burada bir kez düz dict'e çevrilir (tarihler string olur);
+    # msgpack serializer'ı Pydantic modellerini ve date nesnelerini taşıyamaz
+    return [activity.model_dump(mode='json') for activity in result["activities"]]
+
 @shared_task(
     bind=True,
+    ignore_result=False,  # Sonuçlar process_section_parallel tarafından toplanır
+    acks_late=True,  # Worker çökerse chunk kaybolmasın, yeniden kuyruğa girsin
+    # Bir worker'ın chunk başlatma hızını sınırlar; birden çok şubenin group'ları
+    # aynı anda kuyruğa girdiğinde siteye ani yük bindirilmez
+    rate_limit=settings.CHUNK_TASK_RATE_LIMIT,
+    reject_on_worker_lost=True,
     max_retries=3,
     default_retry_delay=60,  # 1 minute delay between retries
     autoretry_for=(Exception,),
@@ -28,7 +75,7 @@ def scrape_activities_chunk(
     section_slug: str,
     start_page: int,
     end_page: int,
-    base_url: str = "https://activities.esn.org"
+    base_url: str = settings.ACTIVITIES_BASE_URL
 ) -> List[Dict[str, Any]]:
     """
     Celery task to scrape a chunk of activities pages for a given section.
@@ -45,17 +92,9 @@ def scrape_activities_chunk(
     logger.info(f"Starting chunk task for {section_slug} pages {start_page}-{end_page}")
     
     try:
-        # Create HTTP client
-        scraper = BaseScraper()
-        activities_url = f"{base_url}/organisation/{section_slug}/activities"
-        
-        # Extract activities for this chunk
-        chunk_activities = extract_activities_chunk(
-            scraper,
-            activities_url,
-            start_page,
-            end_page,
-            base_url
+        # Pages and detail fetches run concurrently inside one event loop
+        chunk_activities = run_async(
+            _scrape_chunk(section_slug, start_page, end_page, base_url)
         )
         
         logger.info(f"Successfully extracted {len(chunk_activities)} activities from chunk {start_page}-{end_page}")
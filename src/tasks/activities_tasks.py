@@ -4,14 +4,15 @@ ESN PULSE Activities Tasks
 Bu modül, activities.esn.org platformundan veri çekme görevlerini içerir.
 """
 
-import asyncio
 import logging
-from datetime import datetime, timedelta
 from typing import Optional
 
 from celery import shared_task
 from celery.utils.log import get_task_logger
 
+from src.scrapers.activities_statistics_scraper import ActivitiesAndStatisticsScraper
+from src.tasks.celery_app import run_async
+
 logger = get_task_logger(__name__)
 
 @shared_task(
@@ -23,14 +24,25 @@ logger = get_task_logger(__name__)
     soft_time_limit=3300,  # 55 dakika
 )
 def run_activities_scraper(self, section_slug: Optional[str] = None):
-    """Scheduled task for running activities scraper.
+    """ActivitiesAndStatisticsScraper'ı çalıştıran Celery görevi.
+    
+    Sayfa aralıkları "chunks" kuyruğundaki worker'lara dağıtılır; bu görev
+    "long" kuyruğunda çalışıp sonuçları toplar.
     
     Args:
-        section_slug: Optional section slug to scrape specific section
+        section_slug: Yalnızca belirli bir şubeyi işlemek için şube slug'ı
     """
     try:
         logger.info(f"Starting activities scraper for section: {section_slug or 'all'}")
+        run_async(_run_activities_scraper(section_slug))
+        
+        logger.info("✅ ActivitiesAndStatisticsScraper başarıyla tamamlandı")
         return True
     except Exception as e:
         logger.error(f"Error in activities scraper: {str(e)}")
-        raise self.retry(exc=e) 
\ No newline at end of file
+        raise self.retry(exc=e)
+
+async def _run_activities_scraper(section_slug: Optional[str] = None):
+    """ActivitiesAndStatisticsScraper'ın asenkron çalıştırma fonksiyonu."""
+    scraper = ActivitiesAndStatisticsScraper()
+    await scraper.scrape(section_slug=section_slug)
@@ -5,11 +5,25 @@ Bu modül, ESN PULSE projesinin Celery görev yönetimini sağlar.
 Scraper görevlerini koordine eder ve bağımlılıkları yönetir.
 """
 
+import asyncio
+import ctypes
+import ctypes.util
+import gc
 import os
+from typing import Awaitable, Callable, List, Optional, TypeVar
+
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import task_postrun, worker_process_init, worker_process_shutdown
 
 from ..config import settings
+from ..database.connection import close_db_connection
+from ..utils.http_client import close_shared_client, get_shared_client, run_with_shared_client
+
+# Kısa, çok sayıdaki chunk görevleri ile saatler süren scraper görevleri ayrı
+# kuyruklarda, farklı prefetch değerleriyle çalışan worker'lara gider
+CHUNK_QUEUE = 'chunks'
+LONG_QUEUE = 'long'
 
 # Celery app oluştur
 celery_app = Celery(
@@ -26,16 +40,58 @@ celery_app = Celery(
 # Celery ayarları
 celery_app.conf.update(
     # Task ayarları
-    task_serializer='json',
-    accept_content=['json'],
-    result_serializer='json',
+    # Chunk sonuçları binlerce etkinlik dict'i taşıyabilir; msgpack hem daha
+    # küçük hem daha hızlı kodlanır. json, kuyrukta kalmış eski mesajlar için
+    # kabul edilmeye devam eder.
+    task_serializer='msgpack',
+    accept_content=['msgpack', 'json'],
+    result_serializer='msgpack',
     timezone='UTC',
     enable_utc=True,
     
+    # Kuyruk yönlendirme: chunk görevleri "chunks", geri kalan her şey "long"
+    task_default_queue=LONG_QUEUE,
+    task_routes={
+        'src.tasks.activities_chunk_task.scrape_activities_chunk': {'queue': CHUNK_QUEUE},
+    },
+    
+    # Sonuç ayarları (yalnızca chunk görevleri sonuç saklar)
+    task_ignore_result=True,
+    result_extended=False,
+    # Chunk sonuçları büyük olabilir: Redis'te sıkıştırılmış tutulur ve toplayan
+    # görev onları hemen okuduğu için uzun süre saklanmaz
+    result_compression='gzip',
+    result_expires=3600,  # 1 saat
+    
+    # Redis bağlantı ayarları
+    # join_native sonuçları tek bir pub/sub bağlantısından okur; keepalive,
+    # uzun bekleyişlerde bu bağlantının sessizce düşmesini önler.
+    redis_socket_keepalive=True,
+    result_backend_transport_options={'socket_keepalive': True},
+    # acks_late ile visibility_timeout, task_time_limit'ten uzun olmalı;
+    # aksi halde 1 saate yaklaşan görevler başka bir worker'a yeniden verilir.
+    broker_transport_options={'visibility_timeout': 3900},
+    # Sınırlı bağlantı havuzu; bağlantı koptuğunda (başlangıç dahil) sınırsız
+    # yeniden dene, worker'lar tek tek düşmesin
+    broker_pool_limit=10,
+    broker_connection_retry_on_startup=True,
+    broker_connection_max_retries=None,
+    
     # Worker ayarları
+    # Uzun süren scrape görevleri için prefetch=1 + acks_late; worker'lar -Ofair
+    # ile başlatılır. -Ofair iyimser prefetch yolunu kapatır: kısa görevlerde
+    # biraz verim kaybı, uzun görevlerde ise daha adil dağılım ve düşük gecikme.
+    # "chunks" kuyruğunu dinleyen worker'lar --prefetch-multiplier=8 ile
+    # başlatılır; kısa I/O görevlerinde broker gidiş-dönüşü gizlenir. Redis
+    # broker'ı toplu ack desteklemez (AMQP basic.ack multiple yoktur); her ack
+    # tek bir pipeline çağrısıdır, bu yüzden kazanç prefetch'ten gelir.
     worker_prefetch_multiplier=1,
+    # -Ofair yalnızca prefork havuzunda etkilidir; havuz açıkça sabitlenir
+    worker_pool='prefork',
     worker_max_tasks_per_child=100,
-    worker_max_memory_per_child=200000,  # 200MB
+    # Fork sonrası alt süreçler yüklü modüllerle zaten ~100-200MB başlar; eşik
+    # bunun çok üstünde tutulur, yoksa her görevden sonra süreç yeniden doğar
+    worker_max_memory_per_child=500000,  # 500MB
     
     # Task yürütme ayarları
     task_acks_late=True,
@@ -70,4 +126,106 @@ def setup_periodic_tasks(sender, **kwargs):
 @celery_app.task(bind=True)
 def debug_task(self):
     """Debug için test görevi."""
-    print(f'Request: {self.request!r}') 
\ No newline at end of file
+    print(f'Request: {self.request!r}') 
+
+# Worker süreci başına uzun ömürlü event loop; paylaşılan HTTP istemcisi döngüye
+# bağlı olduğu için bağlantı havuzu, DNS ve TLS oturumları görevler arasında
+# sıcak kalır
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Döngü kapanmadan önce çalıştırılacak temizlik coroutine'leri (ör. görevler
+# arasında yaşayan scraper'ların kaynakları)
+_loop_cleanups: List[Callable[[], Awaitable[None]]] = []
+
+T = TypeVar("T")
+
+def on_worker_loop_close(cleanup: Callable[[], Awaitable[None]]) -> Callable[[], Awaitable[None]]:
+    """Worker döngüsü kapanırken, paylaşılan istemciden önce çalışacak temizliği kaydeder."""
+    _loop_cleanups.append(cleanup)
+    return cleanup
+
+# Veritabanı havuzu worker döngüsüne bağlıdır; görevler arasında açık kalır
+on_worker_loop_close(close_db_connection)
+
+def in_worker_loop() -> bool:
+    """Çağıran coroutine worker'ın uzun ömürlü event loop'unda mı çalışıyor?"""
+    return _worker_loop is not None and asyncio.get_running_loop() is _worker_loop
+
+@worker_process_init.connect
+def init_worker_loop(**kwargs):
+    """Prefork alt süreci başlarken event loop'u ve paylaşılan istemciyi oluştur.
+    
+    Oturum ve bağlantı havuzu ilk görevi beklemeden hazırlanır; scraper'lar
+    ``get_shared_client`` üzerinden aynı istemciyi alır.
+    """
+    global _worker_loop
+    _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+    _worker_loop.run_until_complete(get_shared_client())
+
+@worker_process_shutdown.connect
+def close_worker_loop(**kwargs):
+    """Alt süreç kapanırken paylaşılan istemciyi ve döngüyü kapat."""
+    global _worker_loop
+    if _worker_loop is None:
+        return
+    try:
+        # Son kaydedilen ilk çalışır (atexit gibi); havuzlar kullanıcılarından sonra kapanır
+        try:
+            for cleanup in reversed(_loop_cleanups):
+                _worker_loop.run_until_complete(cleanup())
+        finally:
+            _worker_loop.run_until_complete(close_shared_client())
+        _worker_loop.run_until_complete(_worker_loop.shutdown_asyncgens())
+    finally:
+        _worker_loop.close()
+        _worker_loop = None
+
+def _load_malloc_trim():
+    """glibc'nin malloc_trim fonksiyonunu döndürür (glibc dışında None)."""
+    libc_name = ctypes.util.find_library("c")
+    if not libc_name:
+        return None
+    try:
+        return ctypes.CDLL(libc_name).malloc_trim
+    except (OSError, AttributeError):
+        return None
+
+_malloc_trim = _load_malloc_trim()
+
+@task_postrun.connect
+def release_task_memory(**kwargs):
+    """Görev sonrası çöpü topla ve boş heap arenalarını işletim sistemine iade et.
+    
+    Ayrıştırılan sayfaların bıraktığı boş arenalar geri verilmezse RSS görevden
+    göreve büyür ve worker_max_memory_per_child sınırına gereksiz yere ulaşılır.
+    """
+    gc.collect()
+    if _malloc_trim is not None:
+        _malloc_trim(0)
+
+def run_async(main: Awaitable[T]) -> T:
+    """Coroutine'i worker'ın uzun ömürlü event loop'unda çalıştırır.
+    
+    Worker alt süreci dışında (ör. eager mod, solo havuz) her çağrı kendi
+    döngüsünü açıp kapatır.
+    
+    Args:
+        main: Çalıştırılacak coroutine
+    
+    Returns:
+        Coroutine'in sonucu
+    """
+    if _worker_loop is None:
+        return run_with_shared_client(main, on_close=reversed(_loop_cleanups))
+    
+    task = _worker_loop.create_task(main)
+    try:
+        return _worker_loop.run_until_complete(task)
+    except BaseException:
+        # Soft time limit gibi dış kesintilerde yarım kalan işi bir sonraki
+        # göreve taşımamak için iptal et
+        if not task.done():
+            task.cancel()
+            _worker_loop.run_until_complete(asyncio.gather(task, return_exceptions=True))
+        raise
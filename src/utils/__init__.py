@@ -6,9 +6,13 @@ Bu paket yardımcı fonksiyonları ve utilities'leri içerir:
 - http_client: HTTP client wrapper
 - slug_generator: Slug oluşturma utilities
 - date_parser: Tarih parsing fonksiyonları
+- rate_limiter: Paylaşılan token bucket rate limiter
+- circuit_breaker: Host bazında paylaşılan circuit breaker
+- concurrency: Sınırlı kuyruklu bulkhead yardımcıları
 """
 
 from .exceptions import (
+    CircuitOpenError,
     CloudflareError,
     ESNPulseError,
     NetworkError,
@@ -17,7 +21,15 @@ from .exceptions import (
     TimeoutError,
     ValidationError
 )
-from .http_client import ESNHTTPClient
+from .http_client import (
+    ESNHTTPClient,
+    close_shared_client,
+    get_shared_client,
+    run_with_shared_client
+)
+from .rate_limiter import get_rate_limiter
+from .circuit_breaker import CircuitBreaker, get_circuit_breaker
+from .concurrency import bounded_gather
 from .slug_generator import (
     generate_activities_slug,
     generate_accounts_slug,
@@ -41,9 +53,17 @@ __all__ = [
     "CloudflareError",
     "NetworkError",
     "TimeoutError",
+    "CircuitOpenError",
     
     # HTTP Client
     "ESNHTTPClient",
+    "get_shared_client",
+    "close_shared_client",
+    "run_with_shared_client",
+    "get_rate_limiter",
+    "CircuitBreaker",
+    "get_circuit_breaker",
+    "bounded_gather",
     
     # Slug Generator
     "generate_activities_slug",
@@ -0,0 +1,93 @@
+"""
+ESN PULSE Circuit Breaker
+
+Bu modül, host bazında paylaşılan circuit breaker'ları içerir. Bir host
+art arda CIRCUIT_FAILURE_THRESHOLD kez geçici hata verdiğinde devre açılır
+ve CIRCUIT_RECOVERY_TIMEOUT süresince o host'a giden istekler beklemeden
+reddedilir. Süre dolunca tek bir deneme isteğine izin verilir (half-open).
+"""
+
+import logging
+import time
+from typing import Dict
+from urllib.parse import urlsplit
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Tek bir host için CLOSED/OPEN/HALF_OPEN durum makinesi."""
+    
+    def __init__(self, host: str, failure_threshold: int, recovery_timeout: float):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+    
+    def allow_request(self) -> bool:
+        """İsteğin gönderilip gönderilemeyeceğini döndürür.
+        
+        Returns:
+            Devre kapalıysa veya deneme isteği hakkı varsa True
+        """
+        if self.state == CLOSED:
+            return True
+        
+        # HALF_OPEN: deneme isteği sonuçlanana kadar diğerleri reddedilir;
+        # sonuçlanmayan (iptal edilen) bir deneme devreyi kilitlemez
+        if time.monotonic() - self._opened_at < self.recovery_timeout:
+            return False
+        
+        # Bekleme süresi doldu; yalnızca bir deneme isteği geçer
+        self.state = HALF_OPEN
+        self._opened_at = time.monotonic()
+        return True
+    
+    def record_success(self) -> None:
+        """Başarılı isteği kaydeder ve devreyi kapatır."""
+        if self.state != CLOSED:
+            logger.info("Circuit closed for %s", self.host)
+        self.state = CLOSED
+        self._failures = 0
+    
+    def record_failure(self) -> None:
+        """Başarısız isteği kaydeder; eşik aşılırsa devreyi açar."""
+        self._failures += 1
+        if self.state == HALF_OPEN or self._failures >= self.failure_threshold:
+            if self.state != OPEN:
+                logger.warning(
+                    "Circuit opened for %s after %d consecutive failures",
+                    self.host, self._failures
+                )
+            self.state = OPEN
+            self._opened_at = time.monotonic()
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+def get_circuit_breaker(url: str) -> CircuitBreaker:
+    """URL'nin host'u için süreç genelinde paylaşılan circuit breaker'ı döndürür.
+    
+    Args:
+        url: İstek URL'si
+        
+    Returns:
+        Host'a ait CircuitBreaker nesnesi
+    """
+    host = urlsplit(url).netloc
+    breaker = _breakers.get(host)
+    if breaker is None:
+        breaker = _breakers[host] = CircuitBreaker(
+            host,
+            failure_threshold=settings.CIRCUIT_FAILURE_THRESHOLD,
+            recovery_timeout=settings.CIRCUIT_RECOVERY_TIMEOUT
+        )
+    return breaker
@@ -0,0 +1,53 @@
+"""
+ESN PULSE Concurrency Helpers
+
+Bu modül, çok sayıda işi sabit sayıda worker ile çalıştıran bulkhead
+yardımcılarını içerir.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, TypeVar, Union
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+async def bounded_gather(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    max_concurrency: int
+) -> List[Union[R, BaseException]]:
+    """Her öğe için ``func`` çağrısını en fazla ``max_concurrency`` eşzamanlı iş ile çalıştırır.
+    
+    ``asyncio.gather`` her öğe için baştan bir coroutine oluştururken burada
+    öğeler ``max_concurrency * 2`` derinliğinde sınırlı bir kuyruktan sabit
+    sayıda worker'a dağıtılır; bellekte yalnızca o an işlenen işler bulunur.
+    
+    Args:
+        func: Her öğe için çağrılacak coroutine fonksiyonu
+        items: İşlenecek öğeler
+        max_concurrency: Eşzamanlı worker sayısı
+        
+    Returns:
+        Öğe sırasıyla sonuçlar; hata veren öğeler için fırlatılan exception
+        (``gather(..., return_exceptions=True)`` gibi)
+    """
+    max_concurrency = max(1, max_concurrency)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_concurrency * 2)
+    results: Dict[int, Any] = {}
+    
+    async def _produce() -> None:
+        for index, item in enumerate(items):
+            await queue.put((index, item))
+        for _ in range(max_concurrency):
+            await queue.put(None)
+    
+    async def _work() -> None:
+        while (entry := await queue.get()) is not None:
+            index, item = entry
+            try:
+                results[index] = await func(item)
+            except Exception as e:
+                results[index] = e
+    
+    await asyncio.gather(_produce(), *(_work() for _ in range(max_concurrency)))
+    return [results[index] for index in range(len(results))]
@@ -5,12 +5,19 @@ Bu modül, ESN PULSE projesinin tarih ayrıştırma fonksiyonlarını içerir.
 """
 
 import re
-from datetime import datetime, date
+from datetime import datetime, date, timezone
 from typing import Optional, Tuple
 
-import pytz
 from dateutil.parser import parse as dateutil_parse
 
+# Sitelerden gelen tarihlerin büyük çoğunluğu ISO formatında (YYYY-MM-DD);
+# bu durumda dateutil'in genel amaçlı ayrıştırıcısına gerek yok
+_ISO_DATE_RE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})$')
+
+# Aralık ayırıcısı: en-dash/em-dash (boşluklu veya boşluksuz) ya da
+# boşluklarla çevrili tire. ISO tarihlerin içindeki tireler bölünmez.
+_RANGE_RE = re.compile(r'\s*[–—]\s*|\s+-\s+')
+
 def parse_event_date(date_str: str) -> date:
     """Etkinlik tarihini ayrıştırır.
     
@@ -24,8 +31,11 @@ def parse_event_date(date_str: str) -> date:
         ValueError: Tarih formatı geçersizse
     """
     try:
+        match = _ISO_DATE_RE.match(date_str.strip())
+        if match:
+            return date(int(match[1]), int(match[2]), int(match[3]))
         return dateutil_parse(date_str).date()
-    except (ValueError, TypeError) as e:
+    except (ValueError, TypeError, AttributeError) as e:
         raise ValueError(f"Geçersiz tarih formatı: {date_str}") from e
 
 def parse_event_date_range(date_range_str: str) -> Tuple[date, Optional[date]]:
@@ -43,7 +53,12 @@ def parse_event_date_range(date_range_str: str) -> Tuple[date, Optional[date]]:
         ValueError: Tarih formatı geçersizse
     """
     # Tarih aralığını ayır
-    parts = [p.strip() for p in date_range_str.split("-")]
+    parts = _RANGE_RE.split(date_range_str.strip(), maxsplit=1)
+    
+    # Boşluksuz tireli aralık ("01/05/2024-03/05/2024"): tek tire varsa
+    # iki tarih olarak ayrılır
+    if len(parts) == 1 and parts[0].count("-") == 1:
+        parts = parts[0].split("-")
     
     # Tek tarih varsa
     if len(parts) == 1:
@@ -102,9 +117,13 @@ def parse_timestamp(timestamp_str: str) -> datetime:
         ValueError: Zaman damgası formatı geçersizse
     """
     try:
-        dt = dateutil_parse(timestamp_str)
+        try:
+            # ISO 8601 zaman damgaları (sonda "Z" dahil) doğrudan ayrıştırılır
+            dt = datetime.fromisoformat(timestamp_str)
+        except ValueError:
+            dt = dateutil_parse(timestamp_str)
         if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=pytz.UTC)
+            dt = dt.replace(tzinfo=timezone.utc)
         return dt
     except (ValueError, TypeError) as e:
         raise ValueError(f"Geçersiz zaman damgası formatı: {timestamp_str}") from e 
\ No newline at end of file
@@ -5,12 +5,31 @@ Bu modül, ESN PULSE projesinin özel hata sınıflarını içerir.
 """
 
 class ESNPulseError(Exception):
-    """ESN PULSE temel hata sınıfı."""
-    pass
+    """ESN PULSE temel hata sınıfı.
+    
+    Alt sınıflar özniteliklerini ``__slots__`` ile tanımlar; değerler
+    sabit slotlarda tutulur. ``BaseException`` her örneğe yine de
+    ``__dict__`` sağladığından bu kayda değer bir bellek tasarrufu
+    getirmez.
+    """
+    
+    __slots__ = ()
+    
+    def __reduce__(self):
+        # Slot öznitelikleri varsayılan pickle durumuna (__dict__) dahil değildir
+        state = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in getattr(cls, "__slots__", ())
+            if hasattr(self, name)
+        }
+        return type(self), self.args, state
 
 class ScrapingError(ESNPulseError):
     """Scraping sırasında oluşan hatalar için temel sınıf."""
     
+    __slots__ = ("url", "status_code")
+    
     def __init__(self, message: str, url: str = None, status_code: int = None):
         self.url = url
         self.status_code = status_code
@@ -19,6 +38,8 @@ class ScrapingError(ESNPulseError):
 class ValidationError(ESNPulseError):
     """Veri doğrulama hataları için temel sınıf."""
     
+    __slots__ = ("field_name", "raw_data")
+    
     def __init__(self, message: str, field_name: str = None, raw_data: dict = None):
         self.field_name = field_name
         self.raw_data = raw_data
@@ -26,24 +47,40 @@ class ValidationError(ESNPulseError):
 
 class RateLimitError(ScrapingError):
     """Rate limit aşıldığında fırlatılan hata."""
-    pass
+    
+    __slots__ = ("retry_after",)
+    
+    def __init__(
+        self,
+        message: str,
+        url: str = None,
+        status_code: int = None,
+        retry_after: float = None
+    ):
+        # Sunucunun Retry-After başlığında istediği bekleme süresi (saniye)
+        self.retry_after = retry_after
+        super().__init__(message, url=url, status_code=status_code)
 
 class CloudflareError(ScrapingError):
     """Cloudflare koruması tespit edildiğinde fırlatılan hata."""
-    pass
+    __slots__ = ()
 
 class NetworkError(ScrapingError):
     """Ağ bağlantısı hataları için temel sınıf."""
-    pass
+    __slots__ = ()
+
+class CircuitOpenError(ScrapingError):
+    """Host'un circuit breaker'ı açıkken istek reddedildiğinde fırlatılan hata."""
+    __slots__ = ()
 
 class TimeoutError(NetworkError):
     """İstek zaman aşımına uğradığında fırlatılan hata."""
-    pass
+    __slots__ = ()
 
 class DatabaseError(ESNPulseError):
     """Veritabanı hataları için temel sınıf."""
-    pass
+    __slots__ = ()
 
 class ConfigurationError(ESNPulseError):
     """Konfigürasyon hataları için temel sınıf."""
-    pass 
\ No newline at end of file
+    __slots__ = () 
\ No newline at end of file
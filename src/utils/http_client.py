@@ -7,12 +7,14 @@ Bu modül, ESN PULSE projesinin HTTP istemcisini içerir.
 import asyncio
 import logging
 import random
-from typing import Dict, List, Optional, Union
+import re
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
 
 import aiohttp
 from aiohttp import ClientResponse, ClientSession, ClientTimeout
 
 from src.config import settings
+from src.utils.rate_limiter import get_rate_limiter
 from src.utils.exceptions import (
     CloudflareError,
     NetworkError,
@@ -22,30 +24,85 @@ from src.utils.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# 403 gövdesinde Cloudflare izi; bayt üzerinde, kopya almadan aranır
+_CLOUDFLARE_RE = re.compile(rb"cloudflare", re.IGNORECASE)
+
+# Yeniden denemeye değer geçici sunucu hataları (429 ayrıca RateLimitError olur)
+TRANSIENT_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+# Rotasyon havuzu süreç başına bir kez, değişmez tuple olarak hazırlanır
+_USER_AGENTS: Tuple[str, ...] = tuple(settings.USER_AGENTS)
+
+# Yeniden denemeler arası bekleme üst sınırı (saniye)
+MAX_BACKOFF = 30.0
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = MAX_BACKOFF) -> float:
+    """Tam jitter'lı, üst sınırlı üstel geri çekilme süresi.
+    
+    Eşzamanlı hatalar aynı anda yeniden denenmesin diye süre
+    ``[0, min(cap, base * 2**attempt)]`` aralığından rastgele seçilir.
+    
+    Args:
+        attempt: Kaçıncı yeniden deneme olduğu (0'dan başlar)
+        base: İlk deneme için taban süre
+        cap: En uzun bekleme süresi
+    
+    Returns:
+        Saniye cinsinden bekleme süresi
+    """
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+# User-Agent her istekte değil, bu kadar istekte bir değiştirilir
+USER_AGENT_ROTATE_EVERY = 50
+
 class ESNHTTPClient:
     """ESN PULSE HTTP istemcisi.
     
     Bu sınıf:
-    1. İnsansı davranış simülasyonu yapar
-    2. Rate limit'leri yönetir
+    1. User-Agent rotasyonu yapar
+    2. İstek hızını süreç geneli token bucket ile, eşzamanlı istek sayısını
+       semaphore ile sınırlar
     3. Cloudflare korumasını tespit eder
     4. Hataları yönetir
     """
     
-    def __init__(self):
-        """HTTP istemcisini başlatır."""
+    def __init__(self, max_concurrency: Optional[int] = None):
+        """HTTP istemcisini başlatır.
+        
+        Args:
+            max_concurrency: Aynı anda gönderilebilecek en fazla istek
+                (varsayılan: MAX_CONCURRENT_REQUESTS)
+        """
         self.session: Optional[ClientSession] = None
-        self.user_agents = settings.USER_AGENTS
-        self.request_delay = settings.SCRAPING_DELAY
+        self.user_agents = _USER_AGENTS
+        self._limiter = get_rate_limiter()
+        # İstemciyi paylaşan tüm scraper'lar için ortak eşzamanlılık tavanı
+        self._slots = asyncio.Semaphore(max_concurrency or settings.MAX_CONCURRENT_REQUESTS)
+        self._request_count = 0
+        self._user_agent = random.choice(self.user_agents)
         self.max_retries = settings.MAX_RETRIES
         self.timeout = ClientTimeout(total=settings.REQUEST_TIMEOUT)
     
     async def __aenter__(self) -> "ESNHTTPClient":
         """Context manager entry."""
         if not self.session:
+            # Bağlantı havuzu, scraper'ların eşzamanlılık sınırlarına göre boyutlandırılır.
+            # İstemci worker süreci boyunca yaşadığından boşta kalan bağlantılar
+            # görevler arasında da yeniden kullanılabilsin diye açık tutulur.
+            # aiodns kuruluysa ("speedups" extra'sı) DNS asenkron çözülür.
+            # Accept-Encoding aiohttp'ye bırakılır: yalnızca çözebildiği
+            # kodlamaları (gzip, deflate; Brotli kuruluysa br) bildirir.
+            connector = aiohttp.TCPConnector(
+                limit=settings.HTTP_POOL_SIZE,
+                limit_per_host=settings.PER_HOST_CONCURRENCY,
+                ttl_dns_cache=300,
+                keepalive_timeout=60
+            )
             self.session = aiohttp.ClientSession(
+                connector=connector,
                 timeout=self.timeout,
-                headers={"User-Agent": random.choice(self.user_agents)}
+                headers={"Accept": "text/html,application/xhtml+xml"},
+                trust_env=False
             )
         return self
     
@@ -79,48 +136,13 @@ class ESNHTTPClient:
             NetworkError: Ağ hatası oluştuğunda
             TimeoutError: İstek zaman aşımına uğradığında
         """
-        if not self.session:
-            await self.__aenter__()
-        
-        # İnsansı davranış simülasyonu
-        await self._simulate_human_behavior()
-        
-        try:
-            # İsteği gönder
-            response = await self.session.get(
-                url,
-                params=params,
-                headers=headers
-            )
-            
-            # Yanıtı kontrol et
-            await self._check_response(response)
-            
-            return response
-        
-        except aiohttp.ClientError as e:
-            # Yeniden deneme sayısını kontrol et
-            if retry_count < self.max_retries:
-                # Üstel geri çekilme
-                wait_time = 2 ** retry_count
-                await asyncio.sleep(wait_time)
-                return await self.get(
-                    url,
-                    params=params,
-                    headers=headers,
-                    retry_count=retry_count + 1
-                )
-            
-            raise NetworkError(
-                f"HTTP isteği başarısız: {str(e)}",
-                url=url
-            ) from e
-        
-        except asyncio.TimeoutError as e:
-            raise TimeoutError(
-                f"HTTP isteği zaman aşımına uğradı: {url}",
-                url=url
-            ) from e
+        return await self._request(
+            "GET",
+            url,
+            retry_count,
+            params=params,
+            headers=headers
+        )
     
     async def get_with_retry(
         self,
@@ -146,6 +168,80 @@ class ESNHTTPClient:
             NetworkError: Ağ hatası oluştuğunda
             TimeoutError: İstek zaman aşımına uğradığında
         """
+        response, content = await self._fetch_with_retry(
+            url,
+            params=params,
+            headers=headers,
+            max_retries=max_retries
+        )
+        
+        if response.status == 404:
+            return ""  # Boş sayfa döndür, böylece sayfalandırma döngüsü sonlanır
+        return content
+    
+    async def get_conditional(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        max_retries: Optional[int] = None
+    ) -> Tuple[int, str, Dict[str, str]]:
+        """Koşullu GET isteği gönderir (If-None-Match / If-Modified-Since).
+        
+        Args:
+            url: İstek URL'i
+            etag: Önceki yanıtın ETag değeri
+            last_modified: Önceki yanıtın Last-Modified değeri
+            max_retries: Maksimum yeniden deneme sayısı
+        
+        Returns:
+            (durum_kodu, içerik, doğrulayıcılar) tuple'ı. 304 yanıtında içerik
+            boştur; doğrulayıcılar yanıttaki "etag" / "last_modified" değerleridir.
+        
+        Raises:
+            RateLimitError: Rate limit aşıldığında
+            CloudflareError: Cloudflare koruması tespit edildiğinde
+            NetworkError: Ağ hatası oluştuğunda
+            TimeoutError: İstek zaman aşımına uğradığında
+        """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        
+        response, content = await self._fetch_with_retry(
+            url,
+            headers=headers,
+            max_retries=max_retries
+        )
+        
+        if response.status == 404:
+            content = ""
+        
+        validators = {}
+        if "ETag" in response.headers:
+            validators["etag"] = response.headers["ETag"]
+        if "Last-Modified" in response.headers:
+            validators["last_modified"] = response.headers["Last-Modified"]
+        
+        return response.status, content, validators
+    
+    async def _fetch_with_retry(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        max_retries: Optional[int] = None
+    ) -> Tuple[ClientResponse, str]:
+        """GET isteğini ağ hatalarında ve 429 yanıtlarında yeniden deneyerek gönderir.
+        
+        429 sonrasında sunucunun Retry-After ile istediği süreden daha kısa
+        beklenmez.
+        
+        Returns:
+            (yanıt, içerik) tuple'ı
+        """
         max_retries = max_retries or self.max_retries
         retry_count = 0
         
@@ -153,27 +249,38 @@ class ESNHTTPClient:
             try:
                 response = await self.get(url, params=params, headers=headers)
                 
-                content = await response.text()
+                # Gövde okunurken hata olsa da bağlantı havuza geri verilir;
+                # durum ve başlıklar release sonrasında da okunabilir
+                async with response:
+                    try:
+                        content = await response.text()
+                    except aiohttp.ClientError as e:
+                        raise NetworkError(
+                            f"Yanıt gövdesi okunamadı: {str(e)}",
+                            url=url,
+                            status_code=response.status
+                        ) from e
+                    except asyncio.TimeoutError as e:
+                        raise TimeoutError(
+                            f"Yanıt gövdesi zaman aşımına uğradı: {url}",
+                            url=url
+                        ) from e
                 
-                if response.status == 200:
-                    return content
-                elif response.status == 404:
-                    return ""  # Boş sayfa döndür, böylece sayfalandırma döngüsü sonlanır
-                else:
-                    return content
+                return response, content
                 
-            except (NetworkError, TimeoutError) as e:
+            except (NetworkError, TimeoutError, RateLimitError) as e:
                 retry_count += 1
                 
                 if retry_count > max_retries:
                     raise
                 
-                # Üstel geri çekilme
-                wait_time = 2 ** retry_count
+                wait_time = backoff_delay(retry_count)
+                if isinstance(e, RateLimitError) and e.retry_after:
+                    wait_time = max(wait_time, e.retry_after)
                 await asyncio.sleep(wait_time)
                 continue
                 
-            except (RateLimitError, CloudflareError) as e:
+            except CloudflareError:
                 raise
     
     async def head(
@@ -198,44 +305,60 @@ class ESNHTTPClient:
             NetworkError: Ağ hatası oluştuğunda
             TimeoutError: İstek zaman aşımına uğradığında
         """
+        return await self._request("HEAD", url, retry_count, headers=headers)
+    
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        retry_count: int = 0,
+        **kwargs: Any
+    ) -> ClientResponse:
+        """İsteği bağlantı hatalarında döngü içinde yeniden deneyerek gönderir.
+        
+        Args:
+            method: HTTP metodu
+            url: İstek URL'i
+            retry_count: Başlangıç deneme sayısı
+            **kwargs: ``ClientSession.request`` parametreleri
+        
+        Returns:
+            HTTP yanıtı
+        """
         if not self.session:
             await self.__aenter__()
         
-        # İnsansı davranış simülasyonu
-        await self._simulate_human_behavior()
+        # User-Agent oturumun ortak başlıklarına değil, her isteğe ayrı yazılır
+        base_headers = kwargs.pop("headers", None) or {}
         
-        try:
-            # İsteği gönder
-            response = await self.session.head(
-                url,
-                headers=headers
-            )
-            # Yanıtı kontrol et
-            await self._check_response(response)
+        for attempt in range(min(retry_count, self.max_retries), self.max_retries + 1):
+            kwargs["headers"] = {"User-Agent": self._next_user_agent(), **base_headers}
             
-            return response
-        
-        except aiohttp.ClientError as e:
-            # Yeniden deneme sayısını kontrol et
-            if retry_count < self.max_retries:
-                # Üstel geri çekilme
-                await asyncio.sleep(2 ** retry_count)
-                return await self.head(
-                    url,
-                    headers=headers,
-                    retry_count=retry_count + 1
-                )
+            try:
+                # İsteği gönder: önce eşzamanlılık yuvası, sonra token (her
+                # deneme bir token harcar; yuva beklerken token harcanmaz)
+                async with self._slots, self._limiter:
+                    response = await self.session.request(method, url, **kwargs)
+                
+                # Yanıtı kontrol et
+                await self._check_response(response)
+                
+                return response
             
-            raise NetworkError(
-                f"HTTP isteği başarısız: {str(e)}",
-                url=url
-            ) from e
-        
-        except asyncio.TimeoutError as e:
-            raise TimeoutError(
-                f"HTTP isteği zaman aşımına uğradı: {url}",
-                url=url
-            ) from e
+            except aiohttp.ClientError as e:
+                if attempt >= self.max_retries:
+                    raise NetworkError(
+                        f"HTTP isteği başarısız: {str(e)}",
+                        url=url
+                    ) from e
+                
+                await asyncio.sleep(backoff_delay(attempt))
+            
+            except asyncio.TimeoutError as e:
+                raise TimeoutError(
+                    f"HTTP isteği zaman aşımına uğradı: {url}",
+                    url=url
+                ) from e
     
     async def _check_response(self, response: ClientResponse):
         """HTTP yanıtını kontrol eder.
@@ -249,31 +372,110 @@ class ESNHTTPClient:
         """
         # HTTP durum kodunu kontrol et
         if response.status == 429:
+            response.release()
             raise RateLimitError(
                 "Rate limit aşıldı",
                 url=str(response.url),
+                status_code=response.status,
+                retry_after=_parse_retry_after(response.headers.get("Retry-After"))
+            )
+        
+        # Geçici sunucu hataları yeniden denenebilir ağ hatası olarak yükseltilir
+        if response.status in TRANSIENT_STATUS_CODES:
+            response.release()
+            raise NetworkError(
+                f"Geçici sunucu hatası: {response.status}",
+                url=str(response.url),
                 status_code=response.status
             )
         
-        # Cloudflare korumasını kontrol et
+        # Cloudflare korumasını kontrol et. Gövde yalnızca 403'te okunur; ham
+        # bayt olarak okunduğu için çağıranın sonraki text() çağrısı önbellekten
+        # gelir ve metin iki kez çözülmez.
         if response.status == 403:
-            text = await response.text()
-            if "cloudflare" in text.lower():
+            if "cf-mitigated" in response.headers or _CLOUDFLARE_RE.search(await response.read()):
                 raise CloudflareError(
                     "Cloudflare koruması tespit edildi",
                     url=str(response.url),
                     status_code=response.status
                 )
     
-    async def _simulate_human_behavior(self):
-        """İnsansı davranış simülasyonu yapar."""
-        # Sabit gecikme
-        await asyncio.sleep(self.request_delay)
-        
-        # Rastgele mola (%5 olasılıkla)
-        if random.random() < 0.05:
-            await asyncio.sleep(random.uniform(2, 5))
+    def _next_user_agent(self) -> str:
+        """Sıradaki isteğin User-Agent'ını döndürür.
         
-        # User-Agent rotasyonu
-        if self.session:
-            self.session._default_headers["User-Agent"] = random.choice(self.user_agents) 
\ No newline at end of file
+        Seçim her ``USER_AGENT_ROTATE_EVERY`` istekte bir yenilenir. İstekler
+        arası sabit bekleme yoktur; hız, paylaşılan rate limiter tarafından
+        sınırlanır.
+        """
+        self._request_count += 1
+        if self._request_count % USER_AGENT_ROTATE_EVERY == 0:
+            self._user_agent = random.choice(self.user_agents)
+        return self._user_agent
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After başlığındaki saniye değerini döndürür (HTTP tarihi desteklenmez)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+# Event loop başına paylaşılan istemciler; aiohttp oturumları oluşturuldukları
+# döngüye bağlıdır. İstemci döngüsüne güçlü referans tuttuğundan kayıtlar
+# kendiliğinden silinmez; close_shared_client ile kaldırılır.
+_shared_clients: Dict[asyncio.AbstractEventLoop, ESNHTTPClient] = {}
+
+async def get_shared_client() -> ESNHTTPClient:
+    """Çalışan event loop için paylaşılan HTTP istemcisini döndürür.
+    
+    Aynı döngüdeki tüm scraper'lar tek bir oturumu ve bağlantı havuzunu
+    kullanır; bağlantılar scraper'lar arasında sıcak kalır.
+    
+    Returns:
+        Açık ESNHTTPClient nesnesi
+    """
+    loop = asyncio.get_running_loop()
+    client = _shared_clients.get(loop)
+    if client is None or client.session is None or client.session.closed:
+        # __aenter__ oturumu askıya alınmadan oluşturur; kontrol ile kayıt
+        # arasında başka bir coroutine araya giremez, kilit gerekmez
+        client = ESNHTTPClient()
+        await client.__aenter__()
+        _shared_clients[loop] = client
+    return client
+
+async def close_shared_client() -> None:
+    """Çalışan event loop'un paylaşılan HTTP istemcisini kapatır."""
+    client = _shared_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.__aexit__(None, None, None)
+
+T = TypeVar("T")
+
+def run_with_shared_client(
+    main: Awaitable[T],
+    on_close: Iterable[Callable[[], Awaitable[None]]] = ()
+) -> T:
+    """``asyncio.run`` gibi çalışır; döngü kapanmadan paylaşılan istemciyi kapatır.
+    
+    Args:
+        main: Çalıştırılacak coroutine
+        on_close: Döngüye bağlı diğer kaynakları (ör. veritabanı havuzu)
+                  kapatan coroutine fonksiyonları; istemciden önce, sırayla
+                  çalıştırılır
+    
+    Returns:
+        Coroutine'in sonucu
+    """
+    async def _run() -> T:
+        try:
+            return await main
+        finally:
+            try:
+                for cleanup in on_close:
+                    await cleanup()
+            finally:
+                await close_shared_client()
+    
+    return asyncio.run(_run())
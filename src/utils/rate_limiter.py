@@ -0,0 +1,33 @@
+"""
+ESN PULSE Rate Limiter
+
+Bu modül, süreç genelinde paylaşılan token bucket rate limiter'ı içerir.
+"""
+
+from typing import Optional
+
+from aiolimiter import AsyncLimiter
+
+from src.config import settings
+
+_limiter: Optional[AsyncLimiter] = None
+
+def get_rate_limiter() -> AsyncLimiter:
+    """Süreç genelinde paylaşılan rate limiter'ı döndürür.
+    
+    Tüm coroutine'ler aynı token bucket'ı kullanır; böylece eşzamanlı
+    istekler toplamda REQUESTS_PER_SECOND sınırını aşmaz.
+    
+    Returns:
+        Paylaşılan AsyncLimiter nesnesi
+    """
+    global _limiter
+    if _limiter is None:
+        rate = settings.REQUESTS_PER_SECOND
+        if rate >= 1:
+            _limiter = AsyncLimiter(rate, 1)
+        else:
+            # Kapasite 1'in altına inemez (tek istek bile alınamaz);
+            # saniyede 1'den az istek, periyot uzatılarak sağlanır
+            _limiter = AsyncLimiter(1, 1 / rate)
+    return _limiter
@@ -5,10 +5,31 @@ Bu modül, ESN PULSE projesinin slug oluşturma fonksiyonlarını içerir.
 """
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 from slugify import slugify
 
+_ESN_PREFIX_RE = re.compile(r"^esn\s+")
+# Slug'larda izin verilen karakterler (küçük harf, rakam ve tire)
+_SLUG_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789-")
+
+# ASCII hızlı yol: harf/rakam dışındaki her karakter (tırnaklar dahil) ayırıcıdır
+_SLUG_TRANSLATION = {
+    code: " " for code in range(128) if not chr(code).isalnum()
+}
+
+def _fast_slug(text: str) -> str:
+    """``slugify`` ile aynı sonucu veren, ASCII girdiler için hızlı yol.
+    
+    Unicode, HTML entity ("&") ve rakam arası virgül ("1,000") içeren
+    girdiler özel kurallar gerektirdiği için ``slugify``'a bırakılır.
+    """
+    if not text.isascii() or "&" in text or "," in text:
+        return slugify(text)
+    return "-".join(text.lower().translate(_SLUG_TRANSLATION).split())
+
+@lru_cache(maxsize=2048)
 def generate_activities_slug(section_name: str) -> str:
     """activities.esn.org için şube slug'ı oluşturur.
     
@@ -26,8 +47,9 @@ def generate_activities_slug(section_name: str) -> str:
         name = f"esn {name}"
     
     # Slug oluştur
-    return slugify(name)
+    return _fast_slug(name)
 
+@lru_cache(maxsize=2048)
 def generate_accounts_slug(section_name: str, country_code: str) -> str:
     """accounts.esn.org için şube slug'ı oluşturur.
     
@@ -42,7 +64,7 @@ def generate_accounts_slug(section_name: str, country_code: str) -> str:
     name = section_name.lower()
     
     # "esn" prefix'ini kaldır
-    name = re.sub(r"^esn\s+", "", name)
+    name = _ESN_PREFIX_RE.sub("", name)
     
     # Şehir ve üniversite kodlarını çıkar
     parts = name.split()
@@ -54,7 +76,7 @@ def generate_accounts_slug(section_name: str, country_code: str) -> str:
         # Tek kelimeyse tamamını al
         slug = f"{country_code.lower()}-{name}"
     
-    return slugify(slug)
+    return _fast_slug(slug)
 
 def validate_activities_slug(slug: str) -> bool:
     """activities.esn.org slug'ının geçerli olup olmadığını kontrol eder.
@@ -66,8 +88,8 @@ def validate_activities_slug(slug: str) -> bool:
         True: Slug geçerli
         False: Slug geçersiz
     """
-    # Boş veya None olamaz
-    if not slug:
+    # Boş veya None olamaz; en az 5 karakter olmalı (esn- + en az 1 karakter)
+    if not slug or len(slug) < 5:
         return False
     
     # "esn" ile başlamalı
@@ -75,14 +97,7 @@ def validate_activities_slug(slug: str) -> bool:
         return False
     
     # Sadece küçük harf, rakam ve tire içermeli
-    if not re.match(r"^[a-z0-9-]+$", slug):
-        return False
-    
-    # En az 5 karakter olmalı (esn- + en az 1 karakter)
-    if len(slug) < 5:
-        return False
-    
-    return True
+    return _SLUG_CHARS.issuperset(slug)
 
 def validate_accounts_slug(slug: str, country_code: Optional[str] = None) -> bool:
     """accounts.esn.org slug'ının geçerli olup olmadığını kontrol eder.
@@ -100,7 +115,7 @@ def validate_accounts_slug(slug: str, country_code: Optional[str] = None) -> boo
         return False
     
     # Sadece küçük harf, rakam ve tire içermeli
-    if not re.match(r"^[a-z0-9-]+$", slug):
+    if not _SLUG_CHARS.issuperset(slug):
         return False
     
     # Ülke kodu verilmişse kontrol et